@@ -45,6 +45,7 @@ class Settings(BaseSettings):
     full_scrape_category_delay: float = 30.0  # Delay between category scrapes
     full_scrape_max_retries: int = 5  # Max consecutive errors before circuit break
     full_scrape_backoff_factor: float = 2.0  # Multiplier for exponential backoff
+    full_scrape_category_concurrency: int = 1  # Categories scraped in parallel (1 = serial)
 
     # LLM APIs (optional)
     openai_api_key: str = ""
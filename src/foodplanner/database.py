@@ -1,13 +1,37 @@
 """Database configuration and session management."""
 
 import os
+from typing import Any
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import URL, create_engine, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+asyncpg://localhost/foodplanner")
 _SQL_ECHO = os.getenv("ENVIRONMENT", "development").lower() == "development"
+# Rows per multi-row INSERT when SQLAlchemy batches executemany (insertmanyvalues)
+_INSERTMANYVALUES_PAGE_SIZE = 10_000
+# Per-connection LRU of asyncpg prepared statements (SQLAlchemy's default is 100)
+_PREPARED_STATEMENT_CACHE_SIZE = 256
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON column values with orjson (non-str keys allowed, like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _async_engine_url(url: str) -> URL:
+    """Size asyncpg's prepared statement cache, unless the URL already sets it."""
+    parsed = make_url(url)
+    if (
+        parsed.get_driver_name() == "asyncpg"
+        and "prepared_statement_cache_size" not in parsed.query
+    ):
+        parsed = parsed.update_query_dict(
+            {"prepared_statement_cache_size": str(_PREPARED_STATEMENT_CACHE_SIZE)}
+        )
+    return parsed
 
 
 class Base(DeclarativeBase):
@@ -17,7 +41,13 @@ class Base(DeclarativeBase):
 
 
 # Async engine for FastAPI endpoints
-async_engine = create_async_engine(DATABASE_URL, echo=_SQL_ECHO)
+async_engine = create_async_engine(
+    _async_engine_url(DATABASE_URL),
+    echo=_SQL_ECHO,
+    insertmanyvalues_page_size=_INSERTMANYVALUES_PAGE_SIZE,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 AsyncSessionLocal = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
@@ -29,6 +59,9 @@ AsyncSessionLocal = async_sessionmaker(
 sync_engine = create_engine(
     DATABASE_URL.replace("+asyncpg", ""),
     echo=_SQL_ECHO,
+    insertmanyvalues_page_size=_INSERTMANYVALUES_PAGE_SIZE,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 
@@ -9,6 +9,7 @@ from rapidfuzz import fuzz, process
 from foodplanner.graph.database import GraphDatabase
 from foodplanner.graph.models import MatchesRelationship
 from foodplanner.graph.repository import GraphRepository
+from foodplanner.graph.service import invalidate_recipe_caches
 from foodplanner.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -309,6 +310,8 @@ class IngredientMatcher:
                     product_names,
                     scorer=fuzz.token_sort_ratio,
                     limit=top_k * 2,
+                    # Lets rapidfuzz skip candidates that cannot reach the threshold
+                    score_cutoff=self.LOW_FUZZY_THRESHOLD,
                 )
 
                 for matched_name, score, _ in fuzzy_matches:
@@ -341,10 +344,9 @@ class IngredientMatcher:
             if len(words) > 1:
                 # Try matching the main word (usually last word)
                 main_word = words[-1]
+                matched_terms = {m.matched_term for m in matches}
                 for product_name in product_names:
-                    if main_word in product_name and product_name not in [
-                        m.matched_term for m in matches
-                    ]:
+                    if main_word in product_name and product_name not in matched_terms:
                         for product in product_cache.get(product_name, []):
                             if product["id"] not in seen_products:
                                 matches.append(
@@ -467,6 +469,8 @@ class IngredientMatcher:
                 f"Processed {min(i + batch_size, len(unmatched))}/{len(unmatched)} ingredients"
             )
 
+        # New MATCHES edges change recipe costs and which recipes have discounts
+        invalidate_recipe_caches()
         return results
 
 
@@ -1,6 +1,7 @@
 """Pydantic models for graph nodes and relationships."""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -190,6 +191,19 @@ class RecipeWithIngredients(BaseModel):
     area: str | None = None
     ingredients: list[dict[str, Any]] = Field(default_factory=list)
 
+    @cached_property
+    def ingredient_names_lower(self) -> frozenset[str]:
+        """Lowercased ingredient names, computed once per instance."""
+        return frozenset(
+            ing.get("name", "").lower() if isinstance(ing, dict) else ing.lower()
+            for ing in self.ingredients
+        )
+
+    @cached_property
+    def ingredient_text_lower(self) -> str:
+        """Lowercased ingredient names joined by newlines, for single-scan keyword checks."""
+        return "\n".join(self.ingredient_names_lower)
+
 
 class IngredientWithProducts(BaseModel):
     """Ingredient with matched products for API responses."""
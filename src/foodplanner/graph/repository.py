@@ -1,5 +1,6 @@
 """Repository for graph database operations with Cypher queries."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from foodplanner.graph.database import GraphDatabase
@@ -135,6 +136,42 @@ class GraphRepository:
             ingredients=[i for i in record["ingredients"] if i.get("name")],
         )
 
+    async def get_recipes_by_ids(self, recipe_ids: list[str]) -> dict[str, RecipeWithIngredients]:
+        """Get several recipes with their relationships in one query, keyed by ID."""
+        query = """
+        UNWIND $recipe_ids AS recipe_id
+        MATCH (r:Recipe {id: recipe_id})
+        OPTIONAL MATCH (r)-[:IN_CATEGORY]->(c:Category)
+        OPTIONAL MATCH (r)-[:FROM_AREA]->(a:Area)
+        OPTIONAL MATCH (r)-[rel:CONTAINS]->(i:Ingredient)
+        RETURN r, c.name as category, a.name as area,
+               collect({
+                   name: i.name,
+                   normalized_name: i.normalized_name,
+                   quantity: rel.quantity,
+                   measure: rel.measure
+               }) as ingredients
+        """
+        results = await self.db.execute_query(query, {"recipe_ids": recipe_ids})
+
+        recipes = {}
+        for record in results:
+            recipe_data = record["r"]
+            recipes[recipe_data["id"]] = RecipeWithIngredients(
+                id=recipe_data["id"],
+                name=recipe_data["name"],
+                instructions=recipe_data.get("instructions", ""),
+                thumbnail=recipe_data.get("thumbnail"),
+                source_url=recipe_data.get("source_url"),
+                youtube_url=recipe_data.get("youtube_url"),
+                tags=recipe_data.get("tags", []),
+                category=record.get("category"),
+                area=record.get("area"),
+                ingredients=[i for i in record["ingredients"] if i.get("name")],
+            )
+
+        return recipes
+
     async def search_recipes(
         self,
         name: str | None = None,
@@ -145,28 +182,9 @@ class GraphRepository:
         offset: int = 0,
     ) -> list[RecipeWithIngredients]:
         """Search recipes with various filters."""
-        conditions = []
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-
-        if name:
-            conditions.append("toLower(r.name) CONTAINS toLower($name)")
-            params["name"] = name
-
-        if category:
-            conditions.append("(r)-[:IN_CATEGORY]->(:Category {name: $category})")
-            params["category"] = category
-
-        if area:
-            conditions.append("(r)-[:FROM_AREA]->(:Area {name: $area})")
-            params["area"] = area
-
-        if ingredient:
-            conditions.append(
-                "(r)-[:CONTAINS]->(:Ingredient {normalized_name: toLower($ingredient)})"
-            )
-            params["ingredient"] = ingredient
-
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        where_clause, params = self._recipe_search_filters(name, category, area, ingredient)
+        params["limit"] = limit
+        params["offset"] = offset
 
         query = f"""
         MATCH (r:Recipe)
@@ -207,6 +225,57 @@ class GraphRepository:
 
         return recipes
 
+    async def count_recipes(
+        self,
+        name: str | None = None,
+        category: str | None = None,
+        area: str | None = None,
+        ingredient: str | None = None,
+    ) -> int:
+        """Count recipes matching the same filters as search_recipes."""
+        where_clause, params = self._recipe_search_filters(name, category, area, ingredient)
+
+        query = f"""
+        MATCH (r:Recipe)
+        {where_clause}
+        RETURN count(r) as total
+        """
+
+        results = await self.db.execute_query(query, params)
+        return results[0]["total"] if results else 0
+
+    @staticmethod
+    def _recipe_search_filters(
+        name: str | None,
+        category: str | None,
+        area: str | None,
+        ingredient: str | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the WHERE clause and parameters shared by recipe search and count."""
+        conditions = []
+        params: dict[str, Any] = {}
+
+        if name:
+            conditions.append("toLower(r.name) CONTAINS toLower($name)")
+            params["name"] = name
+
+        if category:
+            conditions.append("(r)-[:IN_CATEGORY]->(:Category {name: $category})")
+            params["category"] = category
+
+        if area:
+            conditions.append("(r)-[:FROM_AREA]->(:Area {name: $area})")
+            params["area"] = area
+
+        if ingredient:
+            conditions.append(
+                "(r)-[:CONTAINS]->(:Ingredient {normalized_name: toLower($ingredient)})"
+            )
+            params["ingredient"] = ingredient
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where_clause, params
+
     async def delete_recipe(self, recipe_id: str) -> bool:
         """Delete a recipe and its relationships."""
         query = """
@@ -264,15 +333,30 @@ class GraphRepository:
         """
         results = await self.db.execute_query(query, {"limit": limit})
 
-        return [
-            IngredientNode(
-                name=r["i"]["name"],
-                normalized_name=r["i"].get("normalized_name", ""),
-                description=r["i"].get("description"),
-                image_url=r["i"].get("image_url"),
-            )
-            for r in results
-        ]
+        return [self._to_ingredient_node(r["i"]) for r in results]
+
+    async def stream_all_ingredients(self, limit: int = 1000) -> AsyncIterator[IngredientNode]:
+        """Yield ingredients as the driver fetches them, without buffering the result."""
+        query = """
+        MATCH (i:Ingredient)
+        RETURN i
+        ORDER BY i.name
+        LIMIT $limit
+        """
+        async with self.db.session() as session:
+            result = await session.run(query, {"limit": limit})
+            async for record in result:
+                yield self._to_ingredient_node(record["i"])
+
+    @staticmethod
+    def _to_ingredient_node(data: Any) -> IngredientNode:
+        """Build an IngredientNode from a node record or its property dict."""
+        return IngredientNode(
+            name=data["name"],
+            normalized_name=data.get("normalized_name", ""),
+            description=data.get("description"),
+            image_url=data.get("image_url"),
+        )
 
     # =========================================================================
     # Product Operations
@@ -521,6 +605,42 @@ class GraphRepository:
         )
         return results[0] if results else {}
 
+    async def get_recipe_cost_estimates(
+        self,
+        recipe_ids: list[str],
+        prefer_discounts: bool = True,
+    ) -> dict[str, dict[str, Any]]:
+        """Estimate the cost of several recipes in one query, keyed by recipe ID."""
+        query = """
+        UNWIND $recipe_ids AS recipe_id
+        MATCH (r:Recipe {id: recipe_id})-[:CONTAINS]->(i:Ingredient)
+        OPTIONAL MATCH (i)-[m:MATCHES]->(p:Product)
+        WHERE m.confidence_score >= 0.6
+        WITH r, i, p, m
+        ORDER BY
+            CASE WHEN $prefer_discounts AND p.has_active_discount THEN 0 ELSE 1 END,
+            m.confidence_score DESC,
+            COALESCE(p.discount_price, p.price) ASC
+        WITH r, i, collect(p)[0] as best_product
+        RETURN r.id as recipe_id, r.name as recipe_name,
+               collect({
+                   ingredient: i.name,
+                   product_name: best_product.name,
+                   price: best_product.price,
+                   discount_price: best_product.discount_price,
+                   has_discount: best_product.has_active_discount
+               }) as items,
+               sum(COALESCE(best_product.discount_price, best_product.price, 0)) as total_cost,
+               sum(CASE WHEN best_product.has_active_discount
+                   THEN best_product.price - best_product.discount_price
+                   ELSE 0 END) as total_savings
+        """
+        results = await self.db.execute_query(
+            query,
+            {"recipe_ids": recipe_ids, "prefer_discounts": prefer_discounts},
+        )
+        return {record["recipe_id"]: record for record in results}
+
     # =========================================================================
     # Statistics
     # =========================================================================
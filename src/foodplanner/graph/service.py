@@ -1,5 +1,7 @@
 """Business logic service layer for graph operations."""
 
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 from foodplanner.graph.database import GraphDatabase
@@ -20,6 +22,60 @@ from foodplanner.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Recipe cost estimates are memoized process-wide, keyed by (recipe_id, prefer_discounts).
+# Writes through GraphService/IngredientMatcher invalidate them; writes from other
+# processes become visible after the TTL.
+COST_CACHE_TTL = 300.0
+_cost_cache: dict[tuple[str, bool], tuple[float, dict[str, Any]]] = {}
+
+
+def _get_cached_cost(recipe_id: str, prefer_discounts: bool) -> dict[str, Any] | None:
+    """Return a memoized cost estimate, or None if missing or expired."""
+    entry = _cost_cache.get((recipe_id, prefer_discounts))
+    if entry is None:
+        return None
+    expires_at, estimate = entry
+    if expires_at < time.monotonic():
+        _cost_cache.pop((recipe_id, prefer_discounts), None)
+        return None
+    return estimate
+
+
+def _set_cached_cost(recipe_id: str, prefer_discounts: bool, estimate: dict[str, Any]) -> None:
+    _cost_cache[(recipe_id, prefer_discounts)] = (time.monotonic() + COST_CACHE_TTL, estimate)
+
+
+# Recipe searches and the category/area/ingredient listings and graph stats are memoized
+# briefly, keyed by the query arguments, with the same invalidation points as cost
+# estimates. Oldest entries are evicted first.
+SEARCH_CACHE_TTL = 60.0
+SEARCH_CACHE_MAX_ENTRIES = 512
+_search_cache: dict[tuple[Any, ...], tuple[float, list[Any]]] = {}
+
+
+def invalidate_recipe_caches() -> None:
+    """Drop memoized cost estimates and recipe search results (after any graph write)."""
+    _cost_cache.clear()
+    _search_cache.clear()
+
+
+def _get_cached_search(key: tuple[Any, ...]) -> list[Any] | None:
+    """Return a copy of memoized search results, or None if missing or expired."""
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, results = entry
+    if expires_at < time.monotonic():
+        _search_cache.pop(key, None)
+        return None
+    return list(results)
+
+
+def _set_cached_search(key: tuple[Any, ...], results: list[Any]) -> None:
+    if key not in _search_cache and len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, list(results))
+
 
 class GraphService:
     """Service layer for graph business logic."""
@@ -72,6 +128,7 @@ class GraphService:
             area=meal.area,
             ingredients=ingredients,
         )
+        invalidate_recipe_caches()
 
         logger.info(f"Imported recipe '{meal.name}' with {len(meal.ingredients)} ingredients")
         return result
@@ -116,6 +173,12 @@ class GraphService:
         """Get a recipe by ID."""
         return await self.repo.get_recipe_by_id(recipe_id)
 
+    async def get_recipes(self, recipe_ids: list[str]) -> dict[str, RecipeWithIngredients]:
+        """Get several recipes by ID in one round-trip; missing IDs are omitted."""
+        if not recipe_ids:
+            return {}
+        return await self.repo.get_recipes_by_ids(recipe_ids)
+
     async def search_recipes(
         self,
         name: str | None = None,
@@ -126,7 +189,12 @@ class GraphService:
         offset: int = 0,
     ) -> list[RecipeWithIngredients]:
         """Search recipes with filters."""
-        return await self.repo.search_recipes(
+        key = ("search", name, category, area, ingredient, limit, offset)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return cached
+
+        recipes = await self.repo.search_recipes(
             name=name,
             category=category,
             area=area,
@@ -134,10 +202,36 @@ class GraphService:
             limit=limit,
             offset=offset,
         )
+        _set_cached_search(key, recipes)
+        return recipes
+
+    async def count_recipes(
+        self,
+        name: str | None = None,
+        category: str | None = None,
+        area: str | None = None,
+        ingredient: str | None = None,
+    ) -> int:
+        """Count recipes matching search filters."""
+        key = ("count", name, category, area, ingredient)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return cached[0]
+
+        total = await self.repo.count_recipes(
+            name=name,
+            category=category,
+            area=area,
+            ingredient=ingredient,
+        )
+        _set_cached_search(key, [total])
+        return total
 
     async def delete_recipe(self, recipe_id: str) -> bool:
         """Delete a recipe."""
-        return await self.repo.delete_recipe(recipe_id)
+        deleted = await self.repo.delete_recipe(recipe_id)
+        invalidate_recipe_caches()
+        return deleted
 
     # =========================================================================
     # Category and Area Operations
@@ -155,20 +249,38 @@ class GraphService:
             description=description,
             thumbnail=thumbnail,
         )
-        return await self.repo.create_category(category)
+        result = await self.repo.create_category(category)
+        invalidate_recipe_caches()
+        return result
 
     async def import_area(self, name: str) -> dict[str, Any]:
         """Import an area/cuisine."""
         area = AreaNode(name=name)
-        return await self.repo.create_area(area)
+        result = await self.repo.create_area(area)
+        invalidate_recipe_caches()
+        return result
 
     async def get_categories(self) -> list[CategoryNode]:
         """Get all categories."""
-        return await self.repo.get_all_categories()
+        key = ("categories",)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return cached
+
+        categories = await self.repo.get_all_categories()
+        _set_cached_search(key, categories)
+        return categories
 
     async def get_areas(self) -> list[AreaNode]:
         """Get all areas/cuisines."""
-        return await self.repo.get_all_areas()
+        key = ("areas",)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return cached
+
+        areas = await self.repo.get_all_areas()
+        _set_cached_search(key, areas)
+        return areas
 
     # =========================================================================
     # Ingredient Operations
@@ -180,7 +292,18 @@ class GraphService:
 
     async def get_all_ingredients(self, limit: int = 1000) -> list[IngredientNode]:
         """Get all ingredients."""
-        return await self.repo.get_all_ingredients(limit)
+        key = ("ingredients", limit)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return cached
+
+        ingredients = await self.repo.get_all_ingredients(limit)
+        _set_cached_search(key, ingredients)
+        return ingredients
+
+    def stream_all_ingredients(self, limit: int = 1000) -> AsyncIterator[IngredientNode]:
+        """Stream ingredients straight from the graph, bypassing the listing cache."""
+        return self.repo.stream_all_ingredients(limit)
 
     async def get_products_for_ingredient(
         self,
@@ -245,7 +368,9 @@ class GraphService:
             discount_percentage=discount_percentage,
             has_active_discount=has_discount,
         )
-        return await self.repo.upsert_product(product, store_id)
+        result = await self.repo.upsert_product(product, store_id)
+        invalidate_recipe_caches()
+        return result
 
     async def sync_products_batch(self, products: list[dict[str, Any]]) -> dict[str, Any]:
         """
@@ -274,7 +399,9 @@ class GraphService:
             )
             product_tuples.append((product, p["store_id"]))
 
-        return await self.repo.bulk_upsert_products(product_tuples)
+        result = await self.repo.bulk_upsert_products(product_tuples)
+        invalidate_recipe_caches()
+        return result
 
     # =========================================================================
     # Discount-Aware Queries
@@ -295,6 +422,11 @@ class GraphService:
         Returns:
             List of recipes sorted by discount opportunities.
         """
+        key = ("discounts", min_discounted_ingredients, limit)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return cached
+
         results = await self.repo.find_recipes_by_discounted_ingredients(
             min_discounted=min_discounted_ingredients,
             limit=limit,
@@ -323,6 +455,7 @@ class GraphService:
                 )
             )
 
+        _set_cached_search(key, recipes)
         return recipes
 
     async def estimate_recipe_cost(
@@ -340,7 +473,46 @@ class GraphService:
         Returns:
             Cost breakdown with items, total, and savings.
         """
-        return await self.repo.get_recipe_cost_estimate(recipe_id, prefer_discounts)
+        estimate = _get_cached_cost(recipe_id, prefer_discounts)
+        if estimate is None:
+            estimate = await self.repo.get_recipe_cost_estimate(recipe_id, prefer_discounts)
+            _set_cached_cost(recipe_id, prefer_discounts, estimate)
+        return estimate
+
+    async def estimate_recipe_costs(
+        self,
+        recipe_ids: list[str],
+        prefer_discounts: bool = True,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Estimate the cost of several recipes in one round-trip.
+
+        Args:
+            recipe_ids: Recipe IDs.
+            prefer_discounts: Whether to prefer discounted products.
+
+        Returns:
+            Cost breakdown per recipe ID; recipes without ingredients are omitted.
+        """
+        estimates: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for recipe_id in recipe_ids:
+            cached = _get_cached_cost(recipe_id, prefer_discounts)
+            if cached is None:
+                missing.append(recipe_id)
+            elif cached:
+                estimates[recipe_id] = cached
+
+        if missing:
+            fetched = await self.repo.get_recipe_cost_estimates(missing, prefer_discounts)
+            for recipe_id in missing:
+                # Cache misses too, so recipes without ingredients are not re-queried
+                estimate = fetched.get(recipe_id, {})
+                _set_cached_cost(recipe_id, prefer_discounts, estimate)
+                if estimate:
+                    estimates[recipe_id] = estimate
+
+        return estimates
 
     # =========================================================================
     # Statistics
@@ -348,4 +520,11 @@ class GraphService:
 
     async def get_stats(self) -> dict[str, int]:
         """Get graph statistics."""
-        return await self.repo.get_stats()
+        key = ("stats",)
+        cached = _get_cached_search(key)
+        if cached is not None:
+            return dict(cached[0])
+
+        stats = await self.repo.get_stats()
+        _set_cached_search(key, [stats])
+        return dict(stats)
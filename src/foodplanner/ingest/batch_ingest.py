@@ -1,10 +1,13 @@
 """Daily batch ingestion pipeline for scraping data and storing in DB."""
 
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta
+from itertools import islice
 from typing import Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from foodplanner.database import sync_engine
@@ -22,6 +25,11 @@ from foodplanner.models import (
 
 logger = get_logger(__name__)
 
+# Rows per multi-row INSERT ... ON CONFLICT statement
+UPSERT_BATCH_SIZE = 10_000
+# Monthly raw_ingestion_data partitions are named <prefix>YYYY_MM
+RAW_DATA_PARTITION_PREFIX = "raw_ingestion_data_"
+
 
 class IngestionResult:
     """Result of an ingestion operation."""
@@ -75,6 +83,8 @@ async def run_daily_ingestion(
         Base.metadata.create_all(sync_engine)
 
         with Session(sync_engine) as session:
+            ensure_raw_data_partitions(session)
+
             # Check if already run today (unless forced)
             if not force:
                 existing_run = session.execute(
@@ -332,46 +342,61 @@ def _upsert_scraped_products(
     Returns:
         Number of products inserted/updated.
     """
-    products_inserted = 0
+    last_updated = datetime.utcnow()
+    rows = (
+        {
+            "id": product.get("id") or product.get("ean") or str(hash(product.get("name", ""))),
+            "store_id": store_id,
+            "name": product.get("name", "Unknown"),
+            "price": product.get("price", 0.0),
+            "unit": product.get("unit") or "unit",
+            "ean": product.get("ean"),
+            "category": product.get("category"),
+            "brand": product.get("brand"),
+            "image_url": product.get("image_url"),
+            "description": product.get("description"),
+            "origin": product.get("origin"),
+            "last_updated": last_updated,
+        }
+        for product in products
+    )
 
-    for product in products:
-        product_id = product.get("id") or product.get("ean") or str(hash(product.get("name", "")))
+    products_inserted = upsert_product_rows(session, rows)
+    session.commit()
+    return products_inserted
 
-        # Upsert product
-        product_stmt = insert(Product).values(
-            id=product_id,
-            store_id=store_id,
-            name=product.get("name", "Unknown"),
-            price=product.get("price", 0.0),
-            unit=product.get("unit") or "unit",
-            ean=product.get("ean"),
-            category=product.get("category"),
-            brand=product.get("brand"),
-            image_url=product.get("image_url"),
-            description=product.get("description"),
-            origin=product.get("origin"),
-            last_updated=datetime.utcnow(),
-        )
-        product_stmt = product_stmt.on_conflict_do_update(
+
+def upsert_product_rows(session: Session, rows: Iterable[dict[str, Any]]) -> int:
+    """
+    Upsert product rows in batches of ``UPSERT_BATCH_SIZE``.
+
+    Each batch is sent as one executemany, which SQLAlchemy turns into
+    multi-row ``INSERT ... VALUES`` statements (insertmanyvalues). All rows
+    must share the same keys; every column except ``id`` and ``store_id`` is
+    updated on conflict. The caller commits.
+
+    Returns:
+        Number of rows processed.
+    """
+    processed = 0
+    row_iter = iter(rows)
+
+    while batch := list(islice(row_iter, UPSERT_BATCH_SIZE)):
+        # A multi-row upsert may not touch the same id twice; the last row wins,
+        # as it would with row-at-a-time upserts.
+        unique_rows = list({row["id"]: row for row in batch}.values())
+
+        stmt = insert(Product)
+        stmt = stmt.on_conflict_do_update(
             index_elements=["id"],
             set_={
-                "name": product_stmt.excluded.name,
-                "price": product_stmt.excluded.price,
-                "unit": product_stmt.excluded.unit,
-                "ean": product_stmt.excluded.ean,
-                "category": product_stmt.excluded.category,
-                "brand": product_stmt.excluded.brand,
-                "image_url": product_stmt.excluded.image_url,
-                "description": product_stmt.excluded.description,
-                "origin": product_stmt.excluded.origin,
-                "last_updated": product_stmt.excluded.last_updated,
+                key: stmt.excluded[key] for key in unique_rows[0] if key not in ("id", "store_id")
             },
         )
-        session.execute(product_stmt)
-        products_inserted += 1
+        session.execute(stmt, unique_rows)
+        processed += len(batch)
 
-    session.commit()
-    return products_inserted
+    return processed
 
 
 def _archive_raw_data(
@@ -384,17 +409,106 @@ def _archive_raw_data(
     status_code: int,
 ) -> None:
     """Archive raw API response for replayability."""
-    raw_data = RawIngestionData(
-        run_id=run_id,
-        store_id=store_id,
-        endpoint=endpoint,
-        request_params=params,
-        response_data=response_data if isinstance(response_data, (dict, list)) else {},
-        response_status=status_code,
-        fetched_at=datetime.utcnow(),
+    # Core insert: the payload can be large, so skip ORM identity-map bookkeeping
+    session.execute(
+        insert(RawIngestionData).values(
+            run_id=run_id,
+            store_id=store_id,
+            endpoint=endpoint,
+            request_params=params,
+            response_data=response_data if isinstance(response_data, (dict, list)) else {},
+            response_status=status_code,
+            fetched_at=datetime.utcnow(),
+        )
+    )
+    session.commit()
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    """First day of the month ``offset`` months away from ``day``."""
+    month_index = day.year * 12 + day.month - 1 + offset
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _raw_data_is_partitioned(session: Session) -> bool:
+    """Whether raw_ingestion_data is a partitioned PostgreSQL table."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(
+        session.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('raw_ingestion_data'))"
+            )
+        ).scalar()
     )
-    session.add(raw_data)
+
+
+def ensure_raw_data_partitions(session: Session, months_ahead: int = 1) -> int:
+    """
+    Create monthly raw_ingestion_data partitions for this month and the next ones.
+
+    Args:
+        session: Database session; committed on success.
+        months_ahead: Number of future months to create in addition to the current one.
+
+    Returns:
+        Number of partitions ensured (0 when the table is not partitioned).
+    """
+    if not _raw_data_is_partitioned(session):
+        return 0
+
+    this_month = _month_start(date.today())
+    ensured = 0
+    for offset in range(months_ahead + 1):
+        start = _month_start(this_month, offset)
+        end = _month_start(this_month, offset + 1)
+        try:
+            with session.begin_nested():
+                session.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {RAW_DATA_PARTITION_PREFIX}{start:%Y_%m} "
+                        f"PARTITION OF raw_ingestion_data FOR VALUES FROM ('{start}') TO ('{end}')"
+                    )
+                )
+            ensured += 1
+        except DBAPIError as e:
+            # Typically rows for this month already sit in the default partition
+            logger.warning(f"Could not create raw data partition for {start:%Y-%m}: {e}")
     session.commit()
+    return ensured
+
+
+def drop_raw_data_partitions_before(session: Session, cutoff: datetime) -> int:
+    """
+    Drop monthly raw_ingestion_data partitions that end on or before ``cutoff``.
+
+    Dropping a partition is O(1), unlike a DELETE scan. Rows in the default
+    partition or in the partially expired month are left for the caller to delete.
+
+    Returns:
+        Number of partitions dropped.
+    """
+    if not _raw_data_is_partitioned(session):
+        return 0
+
+    partitions = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass('raw_ingestion_data')"
+        )
+    ).scalars()
+
+    dropped = 0
+    for name in partitions:
+        try:
+            start = datetime.strptime(name.removeprefix(RAW_DATA_PARTITION_PREFIX), "%Y_%m")
+        except ValueError:
+            continue  # default partition
+        if _month_start(start.date(), 1) <= cutoff.date():
+            session.execute(text(f'DROP TABLE "{name}"'))
+            dropped += 1
+    return dropped
 
 
 async def cleanup_old_data(days_to_keep: int = 30) -> dict[str, int]:
@@ -413,7 +527,8 @@ async def cleanup_old_data(days_to_keep: int = 30) -> dict[str, int]:
     logger.info(f"Cleaning up data older than {cutoff_date.date()}")
 
     with Session(sync_engine) as session:
-        # Delete old raw data
+        # Drop fully expired monthly partitions, then delete what remains
+        partitions_dropped = drop_raw_data_partitions_before(session, cutoff_date)
         raw_deleted = session.execute(
             delete(RawIngestionData).where(RawIngestionData.fetched_at < cutoff_date)
         ).rowcount
@@ -426,10 +541,12 @@ async def cleanup_old_data(days_to_keep: int = 30) -> dict[str, int]:
         session.commit()
 
         logger.info(
-            f"Cleanup completed: {raw_deleted} raw records, {discounts_deleted} expired discounts"
+            f"Cleanup completed: {partitions_dropped} raw data partitions, "
+            f"{raw_deleted} raw records, {discounts_deleted} expired discounts"
         )
 
         return {
+            "raw_partitions_dropped": partitions_dropped,
             "raw_data_deleted": raw_deleted,
             "discounts_deleted": discounts_deleted,
         }
@@ -5,6 +5,7 @@ Uses Playwright to render the JavaScript-based SPA.
 """
 
 import asyncio
+import contextlib
 import random
 import re
 from collections.abc import AsyncIterator, Callable
@@ -143,6 +144,7 @@ class Rema1000Scraper(BaseScraper):
         detail_max_delay: float = 3.0,
         max_consecutive_errors: int = 5,
         backoff_factor: float = 2.0,
+        category_concurrency: int = 1,
     ):
         """Initialize the scraper.
 
@@ -158,6 +160,7 @@ class Rema1000Scraper(BaseScraper):
             detail_max_delay: Maximum delay between product detail fetches.
             max_consecutive_errors: Max errors before circuit breaker trips.
             backoff_factor: Multiplier for exponential backoff.
+            category_concurrency: Categories scraped at once during a full scrape.
         """
         super().__init__(timeout, rate_limit, max_retries)
         self.headless = headless
@@ -173,6 +176,7 @@ class Rema1000Scraper(BaseScraper):
         self.detail_max_delay = detail_max_delay
         self.max_consecutive_errors = max_consecutive_errors
         self.backoff_factor = backoff_factor
+        self.category_concurrency = max(1, category_concurrency)
 
         # State tracking
         self._consecutive_errors = 0
@@ -242,6 +246,13 @@ class Rema1000Scraper(BaseScraper):
     async def _get_browser(self) -> Browser:
         """Get or create Playwright browser instance."""
         if self._browser is None or not self._browser.is_connected():
+            if self._playwright:
+                # The browser disconnected: stop its driver before starting a new one
+                self._persistent_context = None
+                try:
+                    await self._playwright.stop()
+                except Exception as e:
+                    logger.warning(f"Failed to stop Playwright driver: {e}")
             self._playwright = await async_playwright().start()
             self._browser = await self._playwright.chromium.launch(
                 headless=self.headless,
@@ -765,6 +776,7 @@ class Rema1000Scraper(BaseScraper):
         category_slug: str,
         include_details: bool = True,
         progress: ScrapeProgress | None = None,
+        use_persistent: bool = True,
     ) -> AsyncIterator[dict[str, Any]]:
         """Scrape all products in a category with pagination and optional details.
 
@@ -775,13 +787,14 @@ class Rema1000Scraper(BaseScraper):
             category_slug: Category URL slug (e.g., "frugt-gront").
             include_details: If True, fetch full details for each product.
             progress: Optional progress tracker to update.
+            use_persistent: If False, use a dedicated context that is closed afterwards.
 
         Yields:
             Product dictionaries with full data.
         """
         page = None
         try:
-            page = await self._create_page(use_persistent=True)
+            page = await self._create_page(use_persistent=use_persistent)
             url = f"{self.BASE_URL}/{category_slug}"
             category_name = self.CATEGORY_SLUGS.get(category_slug, category_slug)
 
@@ -809,6 +822,7 @@ class Rema1000Scraper(BaseScraper):
 
             # Fetch details for each product if requested
             if include_details:
+                total = len(products)
                 for i, product in enumerate(products):
                     if progress and progress.is_cancelled:
                         logger.info("Scrape cancelled by user")
@@ -848,9 +862,8 @@ class Rema1000Scraper(BaseScraper):
 
                     yield product
 
-                    # Log progress periodically
-                    if (i + 1) % 50 == 0:
-                        total = len(products)
+                    # Log progress periodically (every 64 products)
+                    if (i & 63) == 63:
                         logger.info(f"Processed {i + 1}/{total} products in {category_name}")
             else:
                 # Yield all products without details
@@ -867,7 +880,8 @@ class Rema1000Scraper(BaseScraper):
 
         finally:
             # Don't close page if using persistent context
-            pass
+            if page and not use_persistent:
+                await page.context.close()
 
     async def scrape_all_products(
         self,
@@ -907,42 +921,51 @@ class Rema1000Scraper(BaseScraper):
         logger.info(f"Starting full scrape of {len(category_slugs)} categories")
 
         try:
-            for i, category_slug in enumerate(category_slugs):
-                if progress.is_cancelled:
-                    logger.info("Full scrape cancelled")
-                    return
+            if self.category_concurrency > 1:
+                async with contextlib.aclosing(
+                    self._scrape_categories_concurrently(
+                        category_slugs, include_details, progress, progress_callback
+                    )
+                ) as products:
+                    async for product in products:
+                        yield product
+            else:
+                for i, category_slug in enumerate(category_slugs):
+                    if progress.is_cancelled:
+                        logger.info("Full scrape cancelled")
+                        return
 
-                progress.current_category = category_slug
+                    progress.current_category = category_slug
 
-                # Rotate identity between categories for anti-blocking
-                if i > 0:
-                    self._rotate_identity()
-                    # Close and recreate persistent context with new identity
-                    if self._persistent_context:
-                        await self._persistent_context.close()
-                        self._persistent_context = None
-
-                logger.info(f"Scraping category {i + 1}/{len(category_slugs)}: {category_slug}")
-
-                # Scrape this category
-                async for product in self.scrape_category_products_full(
-                    category_slug=category_slug,
-                    include_details=include_details,
-                    progress=progress,
-                ):
-                    yield product
+                    # Rotate identity between categories for anti-blocking
+                    if i > 0:
+                        self._rotate_identity()
+                        # Close and recreate persistent context with new identity
+                        if self._persistent_context:
+                            await self._persistent_context.close()
+                            self._persistent_context = None
 
-                progress.categories_completed += 1
+                    logger.info(f"Scraping category {i + 1}/{len(category_slugs)}: {category_slug}")
 
-                # Report progress
-                if progress_callback:
-                    progress_callback(progress)
+                    # Scrape this category
+                    async for product in self.scrape_category_products_full(
+                        category_slug=category_slug,
+                        include_details=include_details,
+                        progress=progress,
+                    ):
+                        yield product
 
-                # Long delay between categories
-                if i < len(category_slugs) - 1:
-                    delay = self.category_delay + random.uniform(0, 10)
-                    logger.info(f"Waiting {delay:.1f}s before next category")
-                    await asyncio.sleep(delay)
+                    progress.categories_completed += 1
+
+                    # Report progress
+                    if progress_callback:
+                        progress_callback(progress)
+
+                    # Long delay between categories
+                    if i < len(category_slugs) - 1:
+                        delay = self.category_delay + random.uniform(0, 10)
+                        logger.info(f"Waiting {delay:.1f}s before next category")
+                        await asyncio.sleep(delay)
 
             logger.info(
                 f"Full scrape completed: {progress.categories_completed} categories, "
@@ -956,6 +979,78 @@ class Rema1000Scraper(BaseScraper):
             if progress_callback:
                 progress_callback(progress)
 
+    async def _scrape_categories_concurrently(
+        self,
+        category_slugs: list[str],
+        include_details: bool,
+        progress: ScrapeProgress,
+        progress_callback: Callable[[ScrapeProgress], None] | None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Scrape categories in category_concurrency parallel lanes.
+
+        Each lane takes the next category from a shared iterator and keeps the
+        usual category_delay pause between its own categories. Every category
+        gets a dedicated browser context with a fresh identity, since the shared
+        persistent context is replaced on each identity rotation. Products are
+        yielded as they arrive from any lane.
+        """
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=100)
+        remaining = iter(category_slugs)
+
+        async def lane() -> None:
+            first = True
+            for category_slug in remaining:
+                if progress.is_cancelled:
+                    return
+                if not first:
+                    delay = self.category_delay + random.uniform(0, 10)
+                    logger.info(f"Waiting {delay:.1f}s before next category")
+                    await asyncio.sleep(delay)
+                first = False
+
+                self._rotate_identity()
+                progress.current_category = category_slug
+                logger.info(f"Scraping category: {category_slug}")
+
+                async with contextlib.aclosing(
+                    self.scrape_category_products_full(
+                        category_slug=category_slug,
+                        include_details=include_details,
+                        progress=progress,
+                        use_persistent=False,
+                    )
+                ) as products:
+                    async for product in products:
+                        await queue.put(product)
+
+                progress.categories_completed += 1
+                if progress_callback:
+                    progress_callback(progress)
+
+        async def run_lanes() -> None:
+            # No sentinel when cancelled: the consumer has stopped reading, so the
+            # queue may be full and nobody is waiting for it
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(min(self.category_concurrency, len(category_slugs))):
+                        group.create_task(lane())
+            except ExceptionGroup as e:
+                await queue.put(None)
+                # Surface the first failure (e.g. a tripped circuit breaker) unwrapped
+                raise e.exceptions[0] from None
+            await queue.put(None)
+
+        runner = asyncio.create_task(run_lanes())
+        try:
+            while (product := await queue.get()) is not None:
+                yield product
+            await runner
+        finally:
+            if not runner.done():
+                # The consumer stopped early; stop the lanes as well
+                runner.cancel()
+                await asyncio.wait([runner])
+
     def cancel_scrape(self, progress: ScrapeProgress) -> None:
         """Cancel an ongoing scrape operation.
 
@@ -992,3 +1087,34 @@ class Rema1000Scraper(BaseScraper):
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
         await self.close()
+
+
+# Shared scraper for health checks, so each probe reuses one running browser
+# instead of launching Chromium
+_health_scraper: Rema1000Scraper | None = None
+_health_scraper_lock = asyncio.Lock()
+
+
+async def get_health_scraper() -> Rema1000Scraper:
+    """
+    Get the shared health-check scraper.
+
+    Launches its browser on first use; a browser that has since disconnected is
+    relaunched by the scraper itself on the next page it opens.
+    """
+    global _health_scraper
+    async with _health_scraper_lock:
+        if _health_scraper is None:
+            scraper = Rema1000Scraper(headless=True)
+            await scraper._get_browser()
+            _health_scraper = scraper
+        return _health_scraper
+
+
+async def close_health_scraper() -> None:
+    """Close the shared health-check scraper, if one was started."""
+    global _health_scraper
+    async with _health_scraper_lock:
+        if _health_scraper is not None:
+            await _health_scraper.close()
+            _health_scraper = None
@@ -54,6 +54,15 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning(f"Error closing Neo4j connection: {e}")
 
+    # Close the scraper browser kept alive for health checks, if one was started.
+    # Imported here so Playwright is only loaded at shutdown, not at startup.
+    from foodplanner.ingest.scrapers.rema1000 import close_health_scraper
+
+    try:
+        await close_health_scraper()
+    except Exception as e:
+        logger.warning(f"Error closing health-check scraper: {e}")
+
     await async_engine.dispose()
 
 
@@ -3,6 +3,7 @@
 from datetime import date, datetime
 
 from sqlalchemy import (
+    DDL,
     JSON,
     Boolean,
     Date,
@@ -11,14 +12,42 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
     Text,
     UniqueConstraint,
+    event,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.functions import FunctionElement
 
 from foodplanner.database import Base
 
+# Binary JSONB on PostgreSQL (pre-parsed, GIN-indexable), plain JSON elsewhere
+PortableJSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utc_now(FunctionElement):
+    """Current UTC timestamp, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _default_utc_now(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "postgresql")
+def _pg_utc_now(element, compiler, **kw):
+    # now() follows the session time zone; pin it to UTC for naive columns
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
 
 class Store(Base):
     """Physical store location."""
@@ -36,9 +65,9 @@ class Store(Base):
     longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     last_ingested_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utc_now(), onupdate=utc_now()
     )
 
     products: Mapped[list["Product"]] = relationship("Product", back_populates="store")
@@ -50,10 +79,19 @@ class Store(Base):
         "StoreIngestionStatus", back_populates="store"
     )
 
+    # Fetch server-generated timestamps with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("idx_stores_zip_code", "zip_code"),
         Index("idx_stores_brand", "brand"),
         Index("idx_stores_is_active", "is_active"),
+        # Health check's pending-store count; predicate must match the query's is_(True)
+        Index(
+            "idx_stores_active_last_ingested",
+            "last_ingested_at",
+            postgresql_where=text("is_active IS true"),
+        ),
     )
 
 
@@ -73,11 +111,18 @@ class Product(Base):
     image_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     origin: Mapped[str | None] = mapped_column(String, nullable=True)
-    nutrition: Mapped[dict] = mapped_column(JSON, default=dict)
-    last_updated: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    nutrition: Mapped[dict] = mapped_column(PortableJSON, default=dict)
+    last_updated: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
 
     store: Mapped["Store"] = relationship("Store", back_populates="products")
-    discounts: Mapped[list["Discount"]] = relationship("Discount", back_populates="product")
+    discounts: Mapped[list["Discount"]] = relationship(
+        "Discount", back_populates="product", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        Index("idx_products_store_category", "store_id", "category"),
+        Index("idx_products_ean", "ean"),
+    )
 
 
 class Discount(Base):
@@ -93,11 +138,16 @@ class Discount(Base):
     valid_from: Mapped[date] = mapped_column(Date, nullable=False)
     valid_to: Mapped[date] = mapped_column(Date, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
 
     product: Mapped["Product"] = relationship("Product", back_populates="discounts")
     store: Mapped["Store"] = relationship("Store", back_populates="discounts")
 
+    __table_args__ = (
+        Index("idx_discounts_store_valid", "store_id", "valid_from", "valid_to"),
+        Index("idx_discounts_product_valid", "product_id", "valid_to"),
+    )
+
 
 class User(Base):
     """User account."""
@@ -107,7 +157,7 @@ class User(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     email: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
 
     preferences: Mapped[list["UserPreference"]] = relationship(
         "UserPreference", back_populates="user"
@@ -127,7 +177,7 @@ class UserPreference(Base):
     user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
     name: Mapped[str] = mapped_column(String, nullable=False)
     type: Mapped[str] = mapped_column(String, nullable=False)  # allergy, preference, restriction
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
 
     user: Mapped["User"] = relationship("User", back_populates="preferences")
 
@@ -141,14 +191,14 @@ class Recipe(Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     servings: Mapped[int] = mapped_column(Integer, nullable=False)
-    ingredients: Mapped[list] = mapped_column(JSON, default=list)
-    instructions: Mapped[list] = mapped_column(JSON, default=list)
-    nutrition_per_serving: Mapped[dict] = mapped_column(JSON, default=dict)
-    tags: Mapped[list] = mapped_column(JSON, default=list)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    ingredients: Mapped[list] = mapped_column(PortableJSON, default=list)
+    instructions: Mapped[list] = mapped_column(PortableJSON, default=list)
+    nutrition_per_serving: Mapped[dict] = mapped_column(PortableJSON, default=dict)
+    tags: Mapped[list] = mapped_column(PortableJSON, default=list)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
 
     meal_plan_recipes: Mapped[list["MealPlanRecipe"]] = relationship(
-        "MealPlanRecipe", back_populates="recipe"
+        "MealPlanRecipe", back_populates="recipe", lazy="raise_on_sql"
     )
 
 
@@ -163,12 +213,15 @@ class MealPlan(Base):
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
     total_cost: Mapped[float] = mapped_column(Float, nullable=False)
     plan_metadata: Mapped[dict] = mapped_column(
-        JSON, default=dict
+        PortableJSON, default=dict
     )  # Renamed from 'metadata' (reserved)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
 
     user: Mapped["User"] = relationship("User", back_populates="meal_plans")
-    recipes: Mapped[list["MealPlanRecipe"]] = relationship("MealPlanRecipe", back_populates="plan")
+    # Loading strategies must be explicit (selectinload) to avoid N+1 queries
+    recipes: Mapped[list["MealPlanRecipe"]] = relationship(
+        "MealPlanRecipe", back_populates="plan", lazy="raise_on_sql"
+    )
 
 
 class MealPlanRecipe(Base):
@@ -177,13 +230,19 @@ class MealPlanRecipe(Base):
     __tablename__ = "meal_plan_recipes"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    meal_plan_id: Mapped[str] = mapped_column(String, ForeignKey("meal_plans.id"))
+    meal_plan_id: Mapped[str] = mapped_column(
+        String, ForeignKey("meal_plans.id", ondelete="CASCADE")
+    )
     recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id"))
     scheduled_date: Mapped[date] = mapped_column(Date, nullable=False)
     meal_type: Mapped[str] = mapped_column(String, nullable=False)  # breakfast, lunch, dinner
 
     plan: Mapped["MealPlan"] = relationship("MealPlan", back_populates="recipes")
-    recipe: Mapped["Recipe"] = relationship("Recipe", back_populates="meal_plan_recipes")
+    recipe: Mapped["Recipe"] = relationship(
+        "Recipe", back_populates="meal_plan_recipes", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (Index("idx_meal_plan_recipes_meal_plan_id", "meal_plan_id"),)
 
 
 class IngestionRun(Base):
@@ -206,7 +265,7 @@ class IngestionRun(Base):
     products_updated: Mapped[int] = mapped_column(Integer, default=0)
     discounts_updated: Mapped[int] = mapped_column(Integer, default=0)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     store_statuses: Mapped[list["StoreIngestionStatus"]] = relationship(
@@ -217,6 +276,10 @@ class IngestionRun(Base):
         Index("idx_ingestion_runs_run_date", "run_date"),
         Index("idx_ingestion_runs_status", "status"),
         Index("idx_ingestion_runs_task_id", "task_id"),
+        Index("idx_ingestion_runs_run_date_status", "run_date", "status"),
+        Index("idx_ingestion_runs_status_completed_at", "status", "completed_at"),
+        # Keyset pagination order for the runs list endpoint
+        Index("idx_ingestion_runs_run_date_id", "run_date", "id"),
     )
 
 
@@ -230,14 +293,16 @@ class UserStorePreference(Base):
     store_id: Mapped[str] = mapped_column(String, ForeignKey("stores.id"), nullable=False)
     priority: Mapped[int] = mapped_column(Integer, default=0)  # Higher = more preferred
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utc_now(), onupdate=utc_now()
     )
 
     user: Mapped["User"] = relationship("User", back_populates="store_preferences")
     store: Mapped["Store"] = relationship("Store", back_populates="user_preferences")
 
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         UniqueConstraint("user_id", "store_id", name="uq_user_store_preference"),
         Index("idx_user_store_prefs_user_id", "user_id"),
@@ -270,28 +335,57 @@ class StoreIngestionStatus(Base):
 
     __table_args__ = (
         UniqueConstraint("run_id", "store_id", name="uq_run_store_status"),
-        Index("idx_store_ingestion_run_id", "run_id"),
         Index("idx_store_ingestion_store_id", "store_id"),
         Index("idx_store_ingestion_status", "status"),
+        Index("idx_store_ingestion_run_status", "run_id", "status"),
     )
 
 
 class RawIngestionData(Base):
-    """Archive of raw API responses for replayability."""
+    """Archive of raw API responses for replayability.
+
+    On PostgreSQL the table is range-partitioned by month on ``fetched_at`` so
+    retention can drop whole partitions; rows outside any monthly partition land
+    in ``raw_ingestion_data_default``.
+    """
 
     __tablename__ = "raw_ingestion_data"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, autoincrement=True)
     run_id: Mapped[int] = mapped_column(Integer, ForeignKey("ingestion_runs.id"), nullable=False)
     store_id: Mapped[str] = mapped_column(String, nullable=False)
     endpoint: Mapped[str] = mapped_column(String(200), nullable=False)  # API endpoint called
-    request_params: Mapped[dict] = mapped_column(JSON, default=dict)  # Query parameters
-    response_data: Mapped[dict] = mapped_column(JSON, nullable=False)  # Raw JSON response
+    request_params: Mapped[dict] = mapped_column(PortableJSON, default=dict)  # Query parameters
+    response_data: Mapped[dict] = mapped_column(PortableJSON, nullable=False)  # Raw JSON response
     response_status: Mapped[int] = mapped_column(Integer, nullable=False)  # HTTP status code
-    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=utc_now())
 
+    # Partitioned tables need the partition key in the primary key; rows are
+    # still identified by id alone on the ORM side.
+    __mapper_args__ = {"primary_key": [id]}
     __table_args__ = (
+        PrimaryKeyConstraint("id", "fetched_at"),
         Index("idx_raw_data_run_id", "run_id"),
         Index("idx_raw_data_store_id", "store_id"),
         Index("idx_raw_data_fetched_at", "fetched_at"),
+        {"postgresql_partition_by": "RANGE (fetched_at)"},
     )
+
+
+# Raw payloads are large and repetitive: compress their TOAST storage with lz4
+# (faster than the pglz default). Set before any partition exists so all inherit it.
+event.listen(
+    RawIngestionData.__table__,
+    "after_create",
+    DDL("ALTER TABLE raw_ingestion_data ALTER response_data SET COMPRESSION lz4").execute_if(
+        dialect="postgresql"
+    ),
+)
+event.listen(
+    RawIngestionData.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS raw_ingestion_data_default "
+        "PARTITION OF raw_ingestion_data DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
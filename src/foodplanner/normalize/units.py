@@ -1,7 +1,9 @@
 """Unit normalization and conversion utilities."""
 
 import re
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from foodplanner.logging_config import get_logger
@@ -124,6 +126,19 @@ COUNT_UNITS: dict[str, float] = {
     "wings": 1.0,
 }
 
+# Base units that normalize to themselves
+_BASE_UNITS: dict[str, str] = {
+    "ml": "volume",
+    "g": "weight",
+}
+
+# Flat unit -> (type, factor) lookup across all conversion tables
+_UNIT_TABLE: dict[str, tuple[str, float]] = {
+    **{unit: ("volume", factor) for unit, factor in VOLUME_UNITS.items()},
+    **{unit: ("weight", factor) for unit, factor in WEIGHT_UNITS.items()},
+    **{unit: ("count", factor) for unit, factor in COUNT_UNITS.items()},
+}
+
 # Approximate size descriptors (convert to count)
 SIZE_DESCRIPTORS: dict[str, float] = {
     "small": 0.75,
@@ -134,16 +149,49 @@ SIZE_DESCRIPTORS: dict[str, float] = {
 }
 
 
-@dataclass
+# =============================================================================
+# Compiled Patterns
+# =============================================================================
+
+# Quantity forms, tried in order: range ("2-3"), mixed fraction ("1 1/2"),
+# simple fraction ("1/2") and bare number ("1.5").
+_QTY_RE = re.compile(
+    r"(?P<range_lo>\d+(?:\.\d+)?)\s*-\s*(?P<range_hi>\d+(?:\.\d+)?)"
+    r"|(?P<mw>\d+)\s+(?P<mn>\d+)/(?P<md>\d+)"
+    r"|(?P<fn>\d+)/(?P<fd>\d+)"
+    r"|(?P<num>\d+(?:\.\d+)?)"
+)
+_MEASURE_RE = re.compile(r"^(\d+(?:\.\d+)?(?:\s*/\s*\d+)?(?:\s+\d+/\d+)?)\s*(.*)$")
+_PURE_NUM_RE = re.compile(r"^\d+(?:\.\d+)?$")
+
+# Common preparation descriptors stripped from ingredient names
+_DESCRIPTOR_RE = re.compile(
+    r"\b(?:fresh|dried|frozen|canned|chopped|diced|minced|sliced|grated|shredded|crushed"
+    r"|ground|whole|halved|quartered|peeled|seeded|pitted|boneless|skinless|cooked|raw"
+    r"|organic|free[- ]range)\b"
+)
+
+# Size descriptors, longest first so "extra large" wins over "large"
+_SIZE_RE = re.compile(
+    "|".join(re.escape(size) for size in sorted(SIZE_DESCRIPTORS, key=len, reverse=True))
+)
+
+
+@dataclass(slots=True)
 class NormalizedQuantity:
     """Represents a normalized quantity with unit type."""
 
     value: float
     unit: str
     unit_type: str  # "volume", "weight", "count", "unknown"
-    original_quantity: str
+    original_quantities: list[str]  # One entry per quantity added together
     original_unit: str
 
+    @property
+    def original_quantity(self) -> str:
+        """Original quantity text, e.g. "2 + 1/2" after aggregation."""
+        return " + ".join(self.original_quantities)
+
     def __add__(self, other: "NormalizedQuantity") -> "NormalizedQuantity":
         """Add two normalized quantities if compatible."""
         if self.unit_type != other.unit_type:
@@ -155,10 +203,22 @@ class NormalizedQuantity:
             value=self.value + other.value,
             unit=self.unit,
             unit_type=self.unit_type,
-            original_quantity=f"{self.original_quantity} + {other.original_quantity}",
+            original_quantities=[*self.original_quantities, *other.original_quantities],
             original_unit=self.unit,
         )
 
+    def iadd(self, other: "NormalizedQuantity") -> "NormalizedQuantity":
+        """Add a compatible quantity in place; same semantics as ``+``, returns self."""
+        if self.unit_type != other.unit_type:
+            # Can't add different unit types, keep self unchanged
+            logger.warning(f"Cannot add {self.unit_type} and {other.unit_type}, keeping first")
+            return self
+
+        self.value += other.value
+        self.original_quantities.extend(other.original_quantities)
+        self.original_unit = self.unit
+        return self
+
     def to_display_string(self) -> tuple[str, str]:
         """Convert back to human-readable format."""
         if self.unit_type == "volume":
@@ -219,36 +279,27 @@ def parse_quantity_string(quantity_str: str) -> float:
     if not quantity_str or quantity_str in ("to taste", "pinch", "dash", "some"):
         return 1.0
 
+    match = _QTY_RE.match(quantity_str)
+    if match is None:
+        return 1.0
+
     # Handle ranges like "2-3" -> return average
-    range_match = re.match(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)", quantity_str)
-    if range_match:
-        low = float(range_match.group(1))
-        high = float(range_match.group(2))
-        return (low + high) / 2
+    if match.group("range_lo") is not None:
+        return (float(match.group("range_lo")) + float(match.group("range_hi"))) / 2
 
     # Handle mixed fractions like "1 1/2"
-    mixed_match = re.match(r"(\d+)\s+(\d+)/(\d+)", quantity_str)
-    if mixed_match:
-        whole = int(mixed_match.group(1))
-        num = int(mixed_match.group(2))
-        denom = int(mixed_match.group(3))
-        return whole + (num / denom)
+    if match.group("mw") is not None:
+        return int(match.group("mw")) + int(match.group("mn")) / int(match.group("md"))
 
     # Handle simple fractions like "1/2"
-    frac_match = re.match(r"(\d+)/(\d+)", quantity_str)
-    if frac_match:
-        num = int(frac_match.group(1))
-        denom = int(frac_match.group(2))
-        return num / denom
+    if match.group("fn") is not None:
+        return int(match.group("fn")) / int(match.group("fd"))
 
     # Handle simple numbers
-    num_match = re.match(r"(\d+(?:\.\d+)?)", quantity_str)
-    if num_match:
-        return float(num_match.group(1))
-
-    return 1.0
+    return float(match.group("num"))
 
 
+@lru_cache(maxsize=8192)
 def identify_unit_type(unit: str) -> tuple[str, float]:
     """
     Identify the unit type and conversion factor.
@@ -258,19 +309,14 @@ def identify_unit_type(unit: str) -> tuple[str, float]:
     """
     unit_lower = unit.lower().strip()
 
-    if unit_lower in VOLUME_UNITS:
-        return "volume", VOLUME_UNITS[unit_lower]
-
-    if unit_lower in WEIGHT_UNITS:
-        return "weight", WEIGHT_UNITS[unit_lower]
-
-    if unit_lower in COUNT_UNITS:
-        return "count", COUNT_UNITS[unit_lower]
+    hit = _UNIT_TABLE.get(unit_lower)
+    if hit is not None:
+        return hit
 
     # Check for size descriptors
-    for size, factor in SIZE_DESCRIPTORS.items():
-        if size in unit_lower:
-            return "count", factor
+    size_match = _SIZE_RE.search(unit_lower)
+    if size_match:
+        return "count", SIZE_DESCRIPTORS[size_match.group()]
 
     return "unknown", 1.0
 
@@ -289,13 +335,16 @@ def normalize_quantity(
     Returns:
         NormalizedQuantity with value in base units.
     """
-    # Parse quantity
-    if quantity is None:
-        qty_value = 1.0
-    elif isinstance(quantity, (int, float)):
+    # Parse quantity, keeping its original text
+    if isinstance(quantity, (int, float)):
         qty_value = float(quantity)
-    else:
+        original_quantity = str(quantity) if quantity else "1"
+    elif quantity:
         qty_value = parse_quantity_string(str(quantity))
+        original_quantity = str(quantity)
+    else:
+        qty_value = 1.0
+        original_quantity = "1"
 
     # Handle no unit
     if not unit:
@@ -303,10 +352,21 @@ def normalize_quantity(
             value=qty_value,
             unit="",
             unit_type="count",
-            original_quantity=str(quantity or "1"),
+            original_quantities=[original_quantity],
             original_unit="",
         )
 
+    # Already in a base unit, no conversion needed
+    base_type = _BASE_UNITS.get(unit)
+    if base_type is not None:
+        return NormalizedQuantity(
+            value=qty_value,
+            unit=unit,
+            unit_type=base_type,
+            original_quantities=[original_quantity],
+            original_unit=unit,
+        )
+
     # Identify unit type and convert
     unit_type, factor = identify_unit_type(unit)
 
@@ -327,7 +387,7 @@ def normalize_quantity(
         value=base_value,
         unit=base_unit,
         unit_type=unit_type,
-        original_quantity=str(quantity or "1"),
+        original_quantities=[original_quantity],
         original_unit=unit,
     )
 
@@ -338,14 +398,16 @@ def can_aggregate(unit1: str | None, unit2: str | None) -> bool:
 
     Returns True if both units are of the same type (volume, weight, or count).
     """
-    type1, _ = identify_unit_type(unit1 or "")
-    type2, _ = identify_unit_type(unit2 or "")
+    return _unit_type_of(unit1) == _unit_type_of(unit2)
 
-    # Unknown types can't be aggregated
-    if type1 == "unknown" or type2 == "unknown":
-        return type1 == type2
 
-    return type1 == type2
+def _unit_type_of(unit: str | None) -> str:
+    """Look up a unit's type, falling back to descriptor matching on a miss."""
+    unit_lower = (unit or "").lower().strip()
+    hit = _UNIT_TABLE.get(unit_lower)
+    if hit is None:
+        hit = identify_unit_type(unit_lower)
+    return hit[0]
 
 
 def extract_quantity_and_unit(measure: str) -> tuple[str, str]:
@@ -363,10 +425,7 @@ def extract_quantity_and_unit(measure: str) -> tuple[str, str]:
     measure = measure.strip()
 
     # Pattern: number(s) followed by unit
-    match = re.match(
-        r"^(\d+(?:\.\d+)?(?:\s*/\s*\d+)?(?:\s+\d+/\d+)?)\s*(.*)$",
-        measure,
-    )
+    match = _MEASURE_RE.match(measure)
 
     if match:
         qty = match.group(1).strip()
@@ -374,11 +433,12 @@ def extract_quantity_and_unit(measure: str) -> tuple[str, str]:
         return qty, unit
 
     # Check if it's just a unit (implied quantity of 1)
-    if measure.lower() in VOLUME_UNITS or measure.lower() in WEIGHT_UNITS:
+    measure_lower = measure.lower()
+    if measure_lower in VOLUME_UNITS or measure_lower in WEIGHT_UNITS:
         return "1", measure
 
     # Check if it's just a number
-    if re.match(r"^\d+(?:\.\d+)?$", measure):
+    if _PURE_NUM_RE.match(measure):
         return measure, ""
 
     # Default: treat as unit with quantity 1
@@ -390,7 +450,7 @@ def extract_quantity_and_unit(measure: str) -> tuple[str, str]:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedIngredient:
     """An ingredient with aggregated quantities from multiple recipes."""
 
@@ -418,44 +478,16 @@ def normalize_ingredient_name(name: str) -> str:
     if not name:
         return ""
 
-    name = name.lower().strip()
-
-    # Remove common preparation descriptors
-    descriptors = [
-        "fresh",
-        "dried",
-        "frozen",
-        "canned",
-        "chopped",
-        "diced",
-        "minced",
-        "sliced",
-        "grated",
-        "shredded",
-        "crushed",
-        "ground",
-        "whole",
-        "halved",
-        "quartered",
-        "peeled",
-        "seeded",
-        "pitted",
-        "boneless",
-        "skinless",
-        "cooked",
-        "raw",
-        "organic",
-        "free-range",
-        "free range",
-    ]
-
-    for desc in descriptors:
-        name = re.sub(rf"\b{desc}\b", "", name)
+    return _normalize_ingredient_name_cached(name)
 
-    # Remove extra whitespace
-    name = " ".join(name.split())
 
-    return name
+@lru_cache(maxsize=8192)
+def _normalize_ingredient_name_cached(name: str) -> str:
+    """Normalize a non-empty ingredient name (memoized)."""
+    name = _DESCRIPTOR_RE.sub("", name.lower().strip())
+
+    # Remove extra whitespace
+    return " ".join(name.split())
 
 
 def aggregate_ingredients(
@@ -472,14 +504,14 @@ def aggregate_ingredients(
     Returns:
         Dict mapping normalized names to AggregatedIngredient.
     """
-    aggregated: dict[str, AggregatedIngredient] = {}
+    # First pass: pull the ingredient fields into parallel columns
+    names: list[str] = []
+    quantities: list[Any] = []
+    measures: list[str] = []
 
     for ing in ingredients:
-        # Extract ingredient info
         if isinstance(ing, str):
-            name = ing
-            quantity = "1"
-            measure = ""
+            name, quantity, measure = ing, "1", ""
         else:
             name = ing.get("name", "")
             quantity = ing.get("quantity", "1")
@@ -488,29 +520,35 @@ def aggregate_ingredients(
         if not name:
             continue
 
-        # Normalize name
-        normalized = normalize_ingredient_name(name)
+        names.append(name)
+        quantities.append(quantity)
+        measures.append(measure)
 
-        # Extract quantity from measure if needed
-        if measure and not quantity:
-            quantity, measure = extract_quantity_and_unit(measure)
+    # Group row indices by normalized name (first occurrence keeps its order)
+    groups: defaultdict[str, list[int]] = defaultdict(list)
+    for i, normalized in enumerate(map(normalize_ingredient_name, names)):
+        groups[normalized].append(i)
 
-        # Normalize quantity
-        norm_qty = normalize_quantity(quantity, measure)
+    # Second pass: normalize quantities and merge each group in place
+    aggregated: dict[str, AggregatedIngredient] = {}
 
-        if normalized in aggregated:
-            # Add to existing
-            existing = aggregated[normalized]
-            existing.total_quantity = existing.total_quantity + norm_qty
-            if recipe_id and recipe_id not in existing.recipe_sources:
-                existing.recipe_sources.append(recipe_id)
-        else:
-            # Create new
-            aggregated[normalized] = AggregatedIngredient(
-                name=name,
-                normalized_name=normalized,
-                total_quantity=norm_qty,
-                recipe_sources=[recipe_id] if recipe_id else [],
-            )
+    for normalized, indices in groups.items():
+        first, *rest = (_normalize_row(quantities[i], measures[i]) for i in indices)
+        for norm_qty in rest:
+            first.iadd(norm_qty)
+
+        aggregated[normalized] = AggregatedIngredient(
+            name=names[indices[0]],
+            normalized_name=normalized,
+            total_quantity=first,
+            recipe_sources=[recipe_id] if recipe_id else [],
+        )
 
     return aggregated
+
+
+def _normalize_row(quantity: Any, measure: str) -> NormalizedQuantity:
+    """Normalize one ingredient row, extracting the quantity from the measure if needed."""
+    if measure and not quantity:
+        quantity, measure = extract_quantity_and_unit(measure)
+    return normalize_quantity(quantity, measure)
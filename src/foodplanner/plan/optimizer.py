@@ -1,6 +1,11 @@
 """Meal plan optimization algorithms."""
 
+import asyncio
+import re
+from collections import Counter
 from dataclasses import dataclass, field
+from itertools import accumulate
+from operator import attrgetter
 from typing import Any
 
 from foodplanner.graph.models import RecipeWithIngredients
@@ -9,8 +14,23 @@ from foodplanner.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Ingredient keywords that rule a recipe out for a dietary preference
+MEAT_KEYWORDS = frozenset({"chicken", "beef", "pork", "lamb", "fish", "bacon", "ham", "salmon"})
+ANIMAL_PRODUCT_KEYWORDS = MEAT_KEYWORDS | {"milk", "cheese", "butter", "cream", "egg", "honey"}
+GLUTEN_KEYWORDS = frozenset({"flour", "bread", "pasta", "wheat", "barley"})
 
-@dataclass
+# Each keyword set compiled once into a single alternation
+_DIETARY_EXCLUSIONS: dict[str, re.Pattern[str]] = {
+    preference: re.compile("|".join(re.escape(kw) for kw in sorted(keywords)))
+    for preference, keywords in (
+        ("vegetarian", MEAT_KEYWORDS),
+        ("vegan", ANIMAL_PRODUCT_KEYWORDS),
+        ("gluten-free", GLUTEN_KEYWORDS),
+    )
+}
+
+
+@dataclass(slots=True)
 class DietaryPreference:
     """User dietary preference."""
 
@@ -18,7 +38,7 @@ class DietaryPreference:
     type: str  # "allergy", "preference", "restriction"
 
 
-@dataclass
+@dataclass(slots=True)
 class RecipeScore:
     """Scored recipe for optimization."""
 
@@ -32,7 +52,7 @@ class RecipeScore:
     suggestion_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizedRecipe:
     """Recipe selected for the meal plan."""
 
@@ -48,6 +68,13 @@ class OptimizedRecipe:
     ingredients: list[dict[str, Any]]
 
 
+def _bang_per_buck(candidate: RecipeScore) -> tuple[bool, float]:
+    """Sort key ranking positive-score recipes by score per krone, then the rest by score."""
+    if candidate.total_score > 0:
+        return True, candidate.total_score / max(candidate.estimated_cost, 1e-6)
+    return False, candidate.total_score
+
+
 class MealPlanOptimizer:
     """
     Optimizes meal plan selection based on:
@@ -123,15 +150,18 @@ class MealPlanOptimizer:
             limit=100,
         )
 
+        # Fetch full recipes and cost estimates for all results in two batched queries
+        recipe_ids = [result.recipe.id for result in discount_recipes]
+        recipes_map, costs_map = await asyncio.gather(
+            self.graph_service.get_recipes(recipe_ids),
+            self.graph_service.estimate_recipe_costs(recipe_ids),
+        )
+
         # Create RecipeScore objects from discount results
         candidates: list[RecipeScore] = []
 
         for result in discount_recipes:
-            recipe = result.recipe
-            discount_count = result.discounted_ingredients
-
-            # Get full recipe details with ingredients
-            full_recipe = await self.graph_service.get_recipe(recipe.id)
+            full_recipe = recipes_map.get(result.recipe.id)
             if not full_recipe:
                 continue
 
@@ -139,8 +169,7 @@ class MealPlanOptimizer:
             if dietary_preferences and not self._matches_dietary(full_recipe, dietary_preferences):
                 continue
 
-            # Get cost estimate
-            cost_estimate = await self.graph_service.estimate_recipe_cost(recipe.id)
+            cost_estimate = costs_map.get(result.recipe.id)
             estimated_cost = cost_estimate.get("total_cost", 0.0) if cost_estimate else 0.0
             estimated_savings = cost_estimate.get("total_savings", 0.0) if cost_estimate else 0.0
 
@@ -153,7 +182,7 @@ class MealPlanOptimizer:
             candidates.append(
                 RecipeScore(
                     recipe=full_recipe,
-                    discount_count=discount_count,
+                    discount_count=result.discounted_ingredients,
                     discounted_ingredients=discounted_names,
                     estimated_cost=estimated_cost,
                     estimated_savings=estimated_savings,
@@ -165,14 +194,18 @@ class MealPlanOptimizer:
             regular_recipes = await self.graph_service.search_recipes(limit=50)
             existing_ids = {c.recipe.id for c in candidates}
 
-            for recipe in regular_recipes:
-                if recipe.id in existing_ids:
-                    continue
-
-                if dietary_preferences and not self._matches_dietary(recipe, dietary_preferences):
-                    continue
+            regular_recipes = [
+                recipe
+                for recipe in regular_recipes
+                if recipe.id not in existing_ids
+                and (not dietary_preferences or self._matches_dietary(recipe, dietary_preferences))
+            ]
+            regular_costs = await self.graph_service.estimate_recipe_costs(
+                [recipe.id for recipe in regular_recipes]
+            )
 
-                cost_estimate = await self.graph_service.estimate_recipe_cost(recipe.id)
+            for recipe in regular_recipes:
+                cost_estimate = regular_costs.get(recipe.id)
                 estimated_cost = cost_estimate.get("total_cost", 0.0) if cost_estimate else 0.0
 
                 candidates.append(
@@ -197,67 +230,24 @@ class MealPlanOptimizer:
         # Simple keyword-based filtering
         # This will be enhanced in Phase 4 with proper dietary inference
 
-        ingredient_names = [
-            ing.get("name", "").lower() if isinstance(ing, dict) else ing.lower()
-            for ing in recipe.ingredients
-        ]
+        ingredient_names = recipe.ingredient_names_lower
         # Note: recipe.tags could be used for dietary filtering in future
 
-        def contains_any_keyword(keywords: set[str]) -> bool:
-            """Check if any ingredient name contains any of the keywords."""
-            for ing in ingredient_names:
-                for kw in keywords:
-                    if kw in ing:
-                        return True
-            return False
+        # Names joined once per recipe, so each preference is a single scan; keywords
+        # never contain newlines, so matches cannot span two ingredients
+        ingredient_text = recipe.ingredient_text_lower
 
         for pref in preferences:
             pref_lower = pref.name.lower()
 
             if pref.type == "allergy":
                 # Check if any ingredient contains the allergen
-                if any(pref_lower in ing for ing in ingredient_names):
-                    return False
-
-            elif pref_lower == "vegetarian":
-                # Check for meat
-                meat_keywords = {
-                    "chicken",
-                    "beef",
-                    "pork",
-                    "lamb",
-                    "fish",
-                    "bacon",
-                    "ham",
-                    "salmon",
-                }
-                if contains_any_keyword(meat_keywords):
-                    return False
-
-            elif pref_lower == "vegan":
-                # Check for animal products
-                animal_keywords = {
-                    "chicken",
-                    "beef",
-                    "pork",
-                    "lamb",
-                    "fish",
-                    "bacon",
-                    "ham",
-                    "salmon",
-                    "milk",
-                    "cheese",
-                    "butter",
-                    "cream",
-                    "egg",
-                    "honey",
-                }
-                if contains_any_keyword(animal_keywords):
+                if ingredient_names and pref_lower in ingredient_text:
                     return False
 
-            elif pref_lower == "gluten-free":
-                gluten_keywords = {"flour", "bread", "pasta", "wheat", "barley"}
-                if contains_any_keyword(gluten_keywords):
+            else:
+                exclusions = _DIETARY_EXCLUSIONS.get(pref_lower)
+                if exclusions and exclusions.search(ingredient_text):
                     return False
 
         return True
@@ -268,22 +258,22 @@ class MealPlanOptimizer:
         people_count: int,
     ) -> list[RecipeScore]:
         """Score all candidate recipes."""
+        discount_weight = self.DISCOUNT_WEIGHT
+        cost_weight = self.COST_WEIGHT
+        people = max(people_count, 1)
+
         for candidate in candidates:
             # Base score from discounts
-            discount_score = candidate.discount_count * self.DISCOUNT_WEIGHT
+            discount_score = candidate.discount_count * discount_weight
 
             # Cost score (adjusted for people count)
-            cost_per_person = candidate.estimated_cost / max(people_count, 1)
-            cost_score = cost_per_person * self.COST_WEIGHT
+            cost_score = candidate.estimated_cost / people * cost_weight
 
-            # Total score
+            # Total score (suggestion reasons are generated only for selected recipes)
             candidate.total_score = discount_score + cost_score
 
-            # Generate suggestion reason
-            candidate.suggestion_reason = self._generate_reason(candidate)
-
         # Sort by score (highest first)
-        candidates.sort(key=lambda x: x.total_score, reverse=True)
+        candidates.sort(key=attrgetter("total_score"), reverse=True)
 
         return candidates
 
@@ -312,31 +302,47 @@ class MealPlanOptimizer:
         budget_max: float | None,
         people_count: int,
     ) -> list[OptimizedRecipe]:
-        """Use greedy algorithm to select recipes."""
+        """
+        Use greedy algorithm to select recipes.
+
+        Without a budget, candidates are taken in score order. With a budget this
+        is a knapsack: candidates are taken in bang-per-buck order (score per krone),
+        and selection stops once no remaining candidate fits in the leftover budget.
+        """
+        if budget_max:
+            scored = sorted(scored, key=_bang_per_buck, reverse=True)
+            # cheapest_from[i] is the lowest recipe cost among scored[i:]
+            cheapest_from = list(
+                accumulate(
+                    (c.estimated_cost * people_count for c in reversed(scored)),
+                    min,
+                )
+            )[::-1]
+
         selected: list[OptimizedRecipe] = []
-        used_categories: dict[str, int] = {}  # Track category usage
+        used_categories: Counter[str] = Counter()  # Track category usage
         used_ingredients: set[str] = set()  # Track ingredient overlap
         total_cost = 0.0
 
-        for candidate in scored:
+        for i, candidate in enumerate(scored):
             if len(selected) >= days:
                 break
 
             # Budget check
             recipe_cost = candidate.estimated_cost * people_count
-            if budget_max and (total_cost + recipe_cost) > budget_max:
-                continue
+            if budget_max:
+                if total_cost + cheapest_from[i] > budget_max:
+                    break
+                if total_cost + recipe_cost > budget_max:
+                    continue
 
             # Variety check: penalize too many from same category
             category = candidate.recipe.category or "Other"
-            if used_categories.get(category, 0) >= 2:
+            if used_categories[category] >= 2:
                 continue
 
             # Calculate ingredient overlap bonus
-            recipe_ingredients = {
-                ing.get("name", "").lower() if isinstance(ing, dict) else ing.lower()
-                for ing in candidate.recipe.ingredients
-            }
+            recipe_ingredients = candidate.recipe.ingredient_names_lower
             overlap = len(recipe_ingredients & used_ingredients)
 
             # Log overlap for debugging (could be used for re-ranking in future)
@@ -355,7 +361,9 @@ class MealPlanOptimizer:
                     area=candidate.recipe.area,
                     estimated_cost=candidate.estimated_cost * people_count,
                     estimated_savings=candidate.estimated_savings * people_count,
-                    suggestion_reason=candidate.suggestion_reason,
+                    suggestion_reason=(
+                        candidate.suggestion_reason or self._generate_reason(candidate)
+                    ),
                     discounted_ingredients=candidate.discounted_ingredients,
                     ingredients=[
                         ing if isinstance(ing, dict) else {"name": ing}
@@ -366,7 +374,7 @@ class MealPlanOptimizer:
 
             # Update tracking
             total_cost += recipe_cost
-            used_categories[category] = used_categories.get(category, 0) + 1
+            used_categories[category] += 1
             used_ingredients.update(recipe_ingredients)
 
         return selected
@@ -395,9 +403,6 @@ class MealPlanOptimizer:
         if not original:
             return []
 
-        original_cost = await self.graph_service.estimate_recipe_cost(recipe_id)
-        original_cost_value = original_cost.get("total_cost", 0.0) if original_cost else 0.0
-
         # Search for alternatives
         if criteria == "cheaper":
             # Same category, lower cost
@@ -419,13 +424,18 @@ class MealPlanOptimizer:
         # Filter and score
         excluded = set(excluded_ids or [])
         excluded.add(recipe_id)
+        candidates = [recipe for recipe in candidates if recipe.id not in excluded]
+
+        # Cost the original and all alternatives in one query
+        costs_map = await self.graph_service.estimate_recipe_costs(
+            [recipe_id, *(recipe.id for recipe in candidates)]
+        )
+        original_cost = costs_map.get(recipe_id)
+        original_cost_value = original_cost.get("total_cost", 0.0) if original_cost else 0.0
 
         results: list[OptimizedRecipe] = []
         for recipe in candidates:
-            if recipe.id in excluded:
-                continue
-
-            cost_estimate = await self.graph_service.estimate_recipe_cost(recipe.id)
+            cost_estimate = costs_map.get(recipe.id)
             estimated_cost = cost_estimate.get("total_cost", 0.0) if cost_estimate else 0.0
             estimated_savings = cost_estimate.get("total_savings", 0.0) if cost_estimate else 0.0
 
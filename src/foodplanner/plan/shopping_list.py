@@ -1,5 +1,7 @@
 """Shopping list generation from meal plans."""
 
+import asyncio
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -13,7 +15,12 @@ from foodplanner.normalize.units import (
 logger = get_logger(__name__)
 
 
-@dataclass
+def _intern(value: str | None) -> str | None:
+    """Intern a repeated grouping key so dict lookups can short-circuit on identity."""
+    return sys.intern(value) if value else value
+
+
+@dataclass(slots=True)
 class ShoppingItem:
     """A single item in the shopping list."""
 
@@ -37,6 +44,11 @@ class ShoppingItem:
     match_confidence: float | None = None
     alternative_products: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Few distinct categories/stores repeat across items and key the grouped views
+        self.category = _intern(self.category)
+        self.store_name = _intern(self.store_name)
+
     @property
     def effective_price(self) -> float | None:
         """Get the effective price (discount or regular)."""
@@ -57,7 +69,7 @@ class ShoppingItem:
         return self.discount_price is not None and self.price is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class ShoppingList:
     """Complete shopping list for a meal plan."""
 
@@ -76,29 +88,36 @@ class ShoppingList:
 
     def add_item(self, item: ShoppingItem) -> None:
         """Add an item and update computed fields."""
-        self.items.append(item)
+        self.add_items([item])
+
+    def add_items(self, items: list[ShoppingItem]) -> None:
+        """Add several items, updating totals and grouped views in one pass."""
+        self.items.extend(items)
 
-        # Update totals
-        if item.effective_price:
-            self.total_cost += item.effective_price
-        self.total_savings += item.savings
+        total_cost = 0.0
+        total_savings = 0.0
+        matched = 0
+        by_category = self.items_by_category
+        by_store = self.items_by_store
 
-        if item.product_id:
-            self.matched_items_count += 1
-        else:
-            self.unmatched_items_count += 1
+        for item in items:
+            # Update totals
+            effective_price = item.effective_price
+            if effective_price:
+                total_cost += effective_price
+            total_savings += item.savings
 
-        # Group by category
-        category = item.category or "Other"
-        if category not in self.items_by_category:
-            self.items_by_category[category] = []
-        self.items_by_category[category].append(item)
+            if item.product_id:
+                matched += 1
 
-        # Group by store
-        store = item.store_name or "Unknown Store"
-        if store not in self.items_by_store:
-            self.items_by_store[store] = []
-        self.items_by_store[store].append(item)
+            # Group by category and store
+            by_category.setdefault(item.category or "Other", []).append(item)
+            by_store.setdefault(item.store_name or "Unknown Store", []).append(item)
+
+        self.total_cost += total_cost
+        self.total_savings += total_savings
+        self.matched_items_count += matched
+        self.unmatched_items_count += len(items) - matched
 
 
 class ShoppingListGenerator:
@@ -110,6 +129,8 @@ class ShoppingListGenerator:
     - Store-specific pricing
     """
 
+    MATCH_CONCURRENCY = 8  # Max in-flight product lookups against the graph
+
     def __init__(self, graph_service: GraphService):
         self.graph_service = graph_service
 
@@ -140,15 +161,18 @@ class ShoppingListGenerator:
             people_count,
         )
 
-        # Step 2: Match ingredients to products
-        shopping_list = ShoppingList(meal_plan_id=meal_plan_id)
+        # Step 2: Match ingredients to products concurrently (bounded)
+        semaphore = asyncio.Semaphore(self.MATCH_CONCURRENCY)
 
-        for agg_ing in aggregated.values():
-            item = await self._create_shopping_item(
-                agg_ing,
-                store_ids,
-            )
-            shopping_list.add_item(item)
+        async def create_item(agg_ing: AggregatedIngredient) -> ShoppingItem:
+            async with semaphore:
+                return await self._create_shopping_item(agg_ing, store_ids)
+
+        items = await asyncio.gather(*(create_item(a) for a in aggregated.values()))
+
+        # Add in aggregation order so the list layout does not depend on timing
+        shopping_list = ShoppingList(meal_plan_id=meal_plan_id)
+        shopping_list.add_items(items)
 
         logger.info(
             f"Generated shopping list: {len(shopping_list.items)} items, "
@@ -170,14 +194,12 @@ class ShoppingListGenerator:
             # Aggregate within this recipe
             recipe_agg = aggregate_ingredients(ingredients, recipe_id)
 
-            # Merge into overall aggregation
+            # Merge into overall aggregation (one dict lookup per ingredient)
             for norm_name, agg_ing in recipe_agg.items():
-                if norm_name in all_aggregated:
-                    existing = all_aggregated[norm_name]
-                    existing.total_quantity = existing.total_quantity + agg_ing.total_quantity
+                existing = all_aggregated.setdefault(norm_name, agg_ing)
+                if existing is not agg_ing:
+                    existing.total_quantity.iadd(agg_ing.total_quantity)
                     existing.recipe_sources.extend(agg_ing.recipe_sources)
-                else:
-                    all_aggregated[norm_name] = agg_ing
 
         # Scale quantities for people count (assuming base recipes serve 2-4)
         # This is a simple scaling - could be more sophisticated
@@ -224,8 +246,8 @@ class ShoppingListGenerator:
                     item.price = best_product.get("p", {}).get("price")
                     item.discount_price = best_product.get("p", {}).get("discount_price")
                     item.store_id = best_product.get("store_id")
-                    item.store_name = best_product.get("store_name")
-                    item.category = best_product.get("p", {}).get("category")
+                    item.store_name = _intern(best_product.get("store_name"))
+                    item.category = _intern(best_product.get("p", {}).get("category"))
                     item.match_confidence = best_product.get("confidence")
 
                     # Store alternatives
@@ -255,13 +277,15 @@ class ShoppingListGenerator:
         if not products:
             return None
 
+        preferred_stores = frozenset(store_ids or ())
+
         def score_product(p: dict[str, Any]) -> tuple[int, int, float, float]:
             """Score a product for sorting (higher is better)."""
             product_data = p.get("p", {})
             store_id = p.get("store_id")
 
             # Preferred store bonus
-            store_score = 1 if store_ids and store_id in store_ids else 0
+            store_score = 1 if store_id in preferred_stores else 0
 
             # Discount bonus
             has_discount = product_data.get("has_active_discount", False)
@@ -276,10 +300,8 @@ class ShoppingListGenerator:
 
             return (store_score, discount_score, price_score, confidence)
 
-        # Sort by score (highest first)
-        sorted_products = sorted(products, key=score_product, reverse=True)
-
-        return sorted_products[0] if sorted_products else None
+        # Single pass; ties keep the earliest product, as a stable descending sort would
+        return max(products, key=score_product)
 
     async def generate_from_db_plan(
         self,
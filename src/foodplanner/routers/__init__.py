@@ -1,10 +1,26 @@
-"""API routers for the foodplanner application."""
+"""API routers for the foodplanner application.
 
-from foodplanner.routers.ingestion import router as ingestion_router
-from foodplanner.routers.meal_plans import router as meal_plans_router
-from foodplanner.routers.recipes import router as recipes_router
-from foodplanner.routers.scraping import router as scraping_router
-from foodplanner.routers.stores import router as stores_router
+Routers are imported lazily on first attribute access, so importing a single
+router module (e.g. from a worker) does not pull in every router's dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from foodplanner.routers.ingestion import router as ingestion_router
+    from foodplanner.routers.meal_plans import router as meal_plans_router
+    from foodplanner.routers.recipes import router as recipes_router
+    from foodplanner.routers.scraping import router as scraping_router
+    from foodplanner.routers.stores import router as stores_router
+
+_LAZY_ROUTERS = {
+    "ingestion_router": "foodplanner.routers.ingestion",
+    "meal_plans_router": "foodplanner.routers.meal_plans",
+    "recipes_router": "foodplanner.routers.recipes",
+    "scraping_router": "foodplanner.routers.scraping",
+    "stores_router": "foodplanner.routers.stores",
+}
 
 __all__ = [
     "ingestion_router",
@@ -13,3 +29,16 @@ __all__ = [
     "scraping_router",
     "stores_router",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ROUTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(module_name).router
+    globals()[name] = router  # Cache so later lookups bypass __getattr__
+    return router
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ROUTERS])
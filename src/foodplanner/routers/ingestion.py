@@ -1,22 +1,46 @@
 """API routes for ingestion pipeline management."""
 
-from datetime import date, datetime
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, date, datetime, timedelta
+from operator import attrgetter
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import func, select
+from sqlalchemy import Float, Row, Select, cast, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
-from foodplanner.database import get_db
+from foodplanner.database import AsyncSessionLocal, get_db
 from foodplanner.logging_config import get_logger
 from foodplanner.models import Discount, IngestionRun, Product, Store
+from foodplanner.tasks.ingestion import (
+    cleanup_old_data_task,
+    health_check_task,
+    run_daily_ingestion_task,
+)
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/ingestion", tags=["ingestion"])
 
+# Seconds a health check result is reused, so rapid probes don't stampede Redis/DB
+HEALTH_CHECK_TTL = 5.0
+_health_check_cache: dict[str, tuple[float, dict]] = {}
+_health_check_lock = asyncio.Lock()
+
+# Circuit breaker: after HEALTH_BREAKER_THRESHOLD failed probes within
+# HEALTH_BREAKER_WINDOW seconds, serve the last unhealthy response for
+# HEALTH_BREAKER_COOLDOWN seconds without touching the database.
+HEALTH_BREAKER_THRESHOLD = 3
+HEALTH_BREAKER_WINDOW = 10.0
+HEALTH_BREAKER_COOLDOWN = 5.0
+_health_breaker: dict = {"failures": 0, "window_start": 0.0, "open_until": 0.0, "response": None}
+
 
 # Response schemas
 class IngestionTriggerRequest(BaseModel):
@@ -91,6 +115,9 @@ class IngestionRunsListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as `cursor` to fetch the next page; None on the last page"
+    )
 
 
 class IngestionHealthResponse(BaseModel):
@@ -119,19 +146,33 @@ class IngestionStatsResponse(BaseModel):
     successful_runs_last_7_days: int
 
 
-@router.post("/trigger", response_model=IngestionTriggerResponse)
+# Field names copied straight off ORM rows when building trusted responses
+_STORE_STATUS_FIELDS = tuple(StoreIngestionStatusResponse.model_fields)
+_get_store_status_fields = attrgetter(*_STORE_STATUS_FIELDS)
+_RUN_FIELDS = tuple(f for f in IngestionRunResponse.model_fields if f != "duration_seconds")
+_get_run_fields = attrgetter(*_RUN_FIELDS)
+
+# Run duration computed by the database for list queries; NULL while a run is in progress
+_RUN_DURATION_SECONDS = cast(
+    func.extract("epoch", IngestionRun.completed_at - IngestionRun.started_at), Float
+).label("duration_seconds")
+
+
+@router.post(
+    "/trigger",
+    response_model=IngestionTriggerResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_ingestion(
     request: IngestionTriggerRequest,
     db: AsyncSession = Depends(get_db),
-) -> IngestionTriggerResponse:
+) -> Response:
     """
     Manually trigger a data ingestion run.
 
     This will queue a Celery task to run the ingestion pipeline.
     Use the returned task_id to check progress via /runs endpoint.
     """
-    from foodplanner.tasks.ingestion import run_daily_ingestion_task
-
     logger.info(f"Manual ingestion trigger: stores={request.store_ids}, force={request.force}")
 
     try:
@@ -141,10 +182,13 @@ async def trigger_ingestion(
             force=request.force,
         )
 
-        return IngestionTriggerResponse(
-            task_id=task.id,
-            status="queued",
-            message="Ingestion task queued successfully. Check /runs for progress.",
+        return _json_response(
+            IngestionTriggerResponse(
+                task_id=task.id,
+                status="queued",
+                message="Ingestion task queued successfully. Check /runs for progress.",
+            ),
+            status_code=status.HTTP_202_ACCEPTED,
         )
 
     except Exception as e:
@@ -160,35 +204,47 @@ async def list_ingestion_runs(
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
     status_filter: Annotated[str | None, Query(description="Filter by status")] = None,
+    cursor: Annotated[
+        str | None,
+        Query(description="Keyset cursor from a previous response's next_cursor; overrides page"),
+    ] = None,
     db: AsyncSession = Depends(get_db),
-) -> IngestionRunsListResponse:
+) -> Response:
     """
     List recent ingestion runs with pagination.
 
-    Returns a paginated list of ingestion runs, most recent first.
+    Returns a paginated list of ingestion runs, most recent first. Following
+    ``next_cursor`` avoids the OFFSET scan that deep ``page`` numbers incur.
     """
-    # Build query
-    query = select(IngestionRun)
-
+    conditions = []
     if status_filter:
-        query = query.where(IngestionRun.status == status_filter)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+        conditions.append(IngestionRun.status == status_filter)
 
-    # Get paginated results
-    query = query.order_by(IngestionRun.run_date.desc(), IngestionRun.id.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    query = select(IngestionRun, _RUN_DURATION_SECONDS).where(*conditions)
+    if cursor:
+        after_run_date, after_id = _parse_runs_cursor(cursor)
+        query = query.where(
+            tuple_(IngestionRun.run_date, IngestionRun.id) < tuple_(after_run_date, after_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.order_by(IngestionRun.run_date.desc(), IngestionRun.id.desc()).limit(page_size)
+
+    # Count directly against the filtered table (no subquery), overlapped with the page query
+    total, result = await asyncio.gather(
+        _count_in_new_session(select(func.count(IngestionRun.id)).where(*conditions)),
+        db.execute(query),
+    )
+    rows = result.all()
 
-    result = await db.execute(query)
-    runs = result.scalars().all()
+    next_cursor = None
+    if len(rows) == page_size:
+        last_run = rows[-1][0]
+        next_cursor = f"{last_run.run_date.isoformat()}:{last_run.id}"
 
-    return IngestionRunsListResponse(
-        runs=[_run_to_response(r) for r in runs],
-        total=total,
-        page=page,
-        page_size=page_size,
+    return StreamingResponse(
+        _stream_runs_list(rows, total, page, page_size, next_cursor),
+        media_type="application/json",
     )
 
 
@@ -196,7 +252,7 @@ async def list_ingestion_runs(
 async def get_ingestion_run(
     run_id: int,
     db: AsyncSession = Depends(get_db),
-) -> IngestionRunDetailResponse:
+) -> Response:
     """
     Get detailed information about a specific ingestion run.
 
@@ -204,7 +260,10 @@ async def get_ingestion_run(
     """
     result = await db.execute(
         select(IngestionRun)
-        .options(selectinload(IngestionRun.store_statuses))
+        .options(
+            selectinload(IngestionRun.store_statuses).raiseload("*"),
+            raiseload("*"),
+        )
         .where(IngestionRun.id == run_id)
     )
     run = result.scalar_one_or_none()
@@ -215,18 +274,14 @@ async def get_ingestion_run(
             detail=f"Ingestion run {run_id} not found",
         )
 
-    response = _run_to_response(run)
-    return IngestionRunDetailResponse(
-        **response.model_dump(),
-        store_statuses=[StoreIngestionStatusResponse.model_validate(s) for s in run.store_statuses],
-    )
+    return _json_response(_run_to_detail_response(run))
 
 
 @router.get("/runs/by-task/{task_id}", response_model=IngestionRunDetailResponse)
 async def get_ingestion_run_by_task(
     task_id: str,
     db: AsyncSession = Depends(get_db),
-) -> IngestionRunDetailResponse:
+) -> Response:
     """
     Get ingestion run by Celery task ID.
 
@@ -234,7 +289,10 @@ async def get_ingestion_run_by_task(
     """
     result = await db.execute(
         select(IngestionRun)
-        .options(selectinload(IngestionRun.store_statuses))
+        .options(
+            selectinload(IngestionRun.store_statuses).raiseload("*"),
+            raiseload("*"),
+        )
         .where(IngestionRun.task_id == task_id)
     )
     run = result.scalar_one_or_none()
@@ -245,126 +303,116 @@ async def get_ingestion_run_by_task(
             detail=f"No ingestion run found for task {task_id}",
         )
 
-    response = _run_to_response(run)
-    return IngestionRunDetailResponse(
-        **response.model_dump(),
-        store_statuses=[StoreIngestionStatusResponse.model_validate(s) for s in run.store_statuses],
-    )
+    return _json_response(_run_to_detail_response(run))
 
 
 @router.get("/health", response_model=IngestionHealthResponse)
 async def get_ingestion_health(
     db: AsyncSession = Depends(get_db),
-) -> IngestionHealthResponse:
+) -> Response:
     """
     Check the health of the ingestion system.
 
     Verifies database and Redis connectivity.
     """
-    from foodplanner.tasks.ingestion import health_check_task
+    if time.monotonic() < _health_breaker["open_until"]:
+        return _json_response(_health_breaker["response"])
 
     logger.info("Running ingestion health check via API")
 
-    # Run health check task synchronously for immediate response
-    try:
-        health_result = health_check_task()
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        health_result = {
-            "database": False,
-            "redis": False,
-            "healthy": False,
-            "error": str(e),
-        }
-
-    # Get last successful run
-    last_success = await db.execute(
-        select(IngestionRun)
-        .where(IngestionRun.status == "completed")
-        .order_by(IngestionRun.completed_at.desc())
-        .limit(1)
+    # The health check, last-run lookup and pending count are independent;
+    # overlap them. The pending count gets its own session because a single
+    # AsyncSession cannot run concurrent statements.
+    health_result, last_run, pending_count = await asyncio.gather(
+        _run_health_check(),
+        _fetch_last_successful_run(db),
+        _count_pending_stores(),
+        return_exceptions=True,
     )
-    last_run = last_success.scalar_one_or_none()
-
-    # Count stores without recent ingestion
-    from datetime import timedelta
 
-    stale_cutoff = datetime.utcnow() - timedelta(days=2)
-    pending_stores = await db.execute(
-        select(func.count(Store.id)).where(
-            Store.is_active == True,  # noqa: E712
-            (Store.last_ingested_at == None) | (Store.last_ingested_at < stale_cutoff),  # noqa: E711
+    db_error = next((r for r in (last_run, pending_count) if isinstance(r, Exception)), None)
+    if db_error is not None:
+        logger.error(f"Health check database queries failed: {db_error}")
+        response = IngestionHealthResponse(
+            healthy=False,
+            database=False,
+            database_error=str(db_error),
+            redis=health_result.get("redis", False),
+            redis_error=health_result.get("redis_error"),
+        )
+        _record_health_failure(response)
+        return _json_response(response)
+
+    _health_breaker["failures"] = 0
+    return _json_response(
+        IngestionHealthResponse(
+            healthy=health_result.get("healthy", False),
+            database=health_result.get("database", False),
+            database_error=health_result.get("database_error"),
+            redis=health_result.get("redis", False),
+            redis_error=health_result.get("redis_error"),
+            last_successful_run=last_run.completed_at if last_run else None,
+            pending_stores=pending_count,
         )
-    )
-    pending_count = pending_stores.scalar() or 0
-
-    return IngestionHealthResponse(
-        healthy=health_result.get("healthy", False),
-        database=health_result.get("database", False),
-        database_error=health_result.get("database_error"),
-        redis=health_result.get("redis", False),
-        redis_error=health_result.get("redis_error"),
-        last_successful_run=last_run.completed_at if last_run else None,
-        pending_stores=pending_count,
     )
 
 
 @router.get("/stats", response_model=IngestionStatsResponse)
 async def get_ingestion_stats(
     db: AsyncSession = Depends(get_db),
-) -> IngestionStatsResponse:
+) -> Response:
     """
     Get statistics about ingested data.
 
     Returns counts of stores, products, discounts, and recent run information.
     """
-    from datetime import timedelta
-
     today = date.today()
     week_ago = today - timedelta(days=7)
 
-    # Counts
-    total_stores = (await db.execute(select(func.count(Store.id)))).scalar() or 0
-    active_stores = (
-        await db.execute(
-            select(func.count(Store.id)).where(Store.is_active == True)  # noqa: E712
-        )
-    ).scalar() or 0
-    total_products = (await db.execute(select(func.count(Product.id)))).scalar() or 0
-    total_discounts = (await db.execute(select(func.count(Discount.id)))).scalar() or 0
-    active_discounts = (
-        await db.execute(select(func.count(Discount.id)).where(Discount.valid_to >= today))
-    ).scalar() or 0
-
-    # Recent runs
-    runs_last_week = (
-        await db.execute(
-            select(func.count(IngestionRun.id)).where(IngestionRun.run_date >= week_ago)
-        )
-    ).scalar() or 0
-    successful_runs = (
-        await db.execute(
-            select(func.count(IngestionRun.id)).where(
-                IngestionRun.run_date >= week_ago, IngestionRun.status == "completed"
+    # All counts in a single round-trip, overlapped with the last-run lookup
+    counts_result, last_run = await asyncio.gather(
+        db.execute(
+            select(
+                select(func.count(Store.id)).scalar_subquery(),
+                select(func.count(Store.id))
+                .where(Store.is_active == True)  # noqa: E712
+                .scalar_subquery(),
+                select(func.count(Product.id)).scalar_subquery(),
+                select(func.count(Discount.id)).scalar_subquery(),
+                select(func.count(Discount.id)).where(Discount.valid_to >= today).scalar_subquery(),
+                select(func.count(IngestionRun.id))
+                .where(IngestionRun.run_date >= week_ago)
+                .scalar_subquery(),
+                select(func.count(IngestionRun.id))
+                .where(IngestionRun.run_date >= week_ago, IngestionRun.status == "completed")
+                .scalar_subquery(),
             )
+        ),
+        _fetch_last_run(),
+    )
+    counts = counts_result.one()
+    (
+        total_stores,
+        active_stores,
+        total_products,
+        total_discounts,
+        active_discounts,
+        runs_last_week,
+        successful_runs,
+    ) = (count or 0 for count in counts)
+
+    return _json_response(
+        IngestionStatsResponse(
+            total_stores=total_stores,
+            active_stores=active_stores,
+            total_products=total_products,
+            total_discounts=total_discounts,
+            active_discounts=active_discounts,
+            last_run_date=last_run.run_date if last_run else None,
+            last_run_status=last_run.status if last_run else None,
+            runs_last_7_days=runs_last_week,
+            successful_runs_last_7_days=successful_runs,
         )
-    ).scalar() or 0
-
-    # Last run
-    last_run = (
-        await db.execute(select(IngestionRun).order_by(IngestionRun.run_date.desc()).limit(1))
-    ).scalar_one_or_none()
-
-    return IngestionStatsResponse(
-        total_stores=total_stores,
-        active_stores=active_stores,
-        total_products=total_products,
-        total_discounts=total_discounts,
-        active_discounts=active_discounts,
-        last_run_date=last_run.run_date if last_run else None,
-        last_run_status=last_run.status if last_run else None,
-        runs_last_7_days=runs_last_week,
-        successful_runs_last_7_days=successful_runs,
     )
 
 
@@ -377,8 +425,6 @@ async def trigger_cleanup(
 
     This will queue a task to delete old raw data and expired discounts.
     """
-    from foodplanner.tasks.ingestion import cleanup_old_data_task
-
     logger.info(f"Cleanup triggered: keeping {days_to_keep} days")
 
     try:
@@ -396,25 +442,145 @@ async def trigger_cleanup(
         )
 
 
-def _run_to_response(run: IngestionRun) -> IngestionRunResponse:
-    """Convert IngestionRun model to response schema."""
+async def _run_health_check() -> dict:
+    """Run the blocking health check task in a worker thread.
+
+    Results are reused for HEALTH_CHECK_TTL seconds, and the lock makes concurrent
+    probes wait for one in-flight check instead of each starting their own.
+    """
+    async with _health_check_lock:
+        cached = _health_check_cache.get("result")
+        if cached is not None and cached[0] >= time.monotonic():
+            return cached[1]
+
+        try:
+            result = await asyncio.to_thread(health_check_task)
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            result = {
+                "database": False,
+                "redis": False,
+                "healthy": False,
+                "error": str(e),
+            }
+        _health_check_cache["result"] = (time.monotonic() + HEALTH_CHECK_TTL, result)
+        return result
+
+
+def _record_health_failure(response: IngestionHealthResponse) -> None:
+    """Count a failed health probe, opening the circuit breaker past the threshold."""
+    now = time.monotonic()
+    if now - _health_breaker["window_start"] > HEALTH_BREAKER_WINDOW:
+        _health_breaker["window_start"] = now
+        _health_breaker["failures"] = 0
+    _health_breaker["failures"] += 1
+    if _health_breaker["failures"] >= HEALTH_BREAKER_THRESHOLD:
+        logger.warning(f"Health circuit breaker open for {HEALTH_BREAKER_COOLDOWN}s")
+        _health_breaker["open_until"] = now + HEALTH_BREAKER_COOLDOWN
+        _health_breaker["response"] = response
+        _health_breaker["failures"] = 0
+
+
+async def _fetch_last_successful_run(db: AsyncSession) -> IngestionRun | None:
+    """Get the most recently completed ingestion run."""
+    return await db.scalar(
+        select(IngestionRun)
+        .options(raiseload("*"))
+        .where(IngestionRun.status == "completed")
+        .order_by(IngestionRun.completed_at.desc())
+        .limit(1)
+    )
+
+
+async def _fetch_last_run() -> IngestionRun | None:
+    """Get the most recent ingestion run, using a dedicated session."""
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(IngestionRun)
+            .options(raiseload("*"))
+            .order_by(IngestionRun.run_date.desc())
+            .limit(1)
+        )
+
+
+async def _count_pending_stores() -> int:
+    """Count active stores without recent ingestion, using a dedicated session."""
+    # Columns are naive UTC timestamps; asyncpg rejects tz-aware binds for them
+    stale_cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=2)
+    return await _count_in_new_session(
+        select(func.count(Store.id)).where(
+            Store.is_active.is_(True),
+            (Store.last_ingested_at == None) | (Store.last_ingested_at < stale_cutoff),  # noqa: E711
+        )
+    )
+
+
+async def _count_in_new_session(stmt: Select) -> int:
+    """Run a COUNT statement on a dedicated session so it can overlap the request's."""
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(stmt) or 0
+
+
+async def _stream_runs_list(
+    rows: Sequence[Row], total: int, page: int, page_size: int, next_cursor: str | None
+) -> AsyncIterator[bytes]:
+    """Yield an IngestionRunsListResponse body one serialized run at a time.
+
+    Avoids holding a response model list and the full JSON buffer alongside the rows.
+    """
+    yield b'{"runs":['
+    for i, (run, duration) in enumerate(rows):
+        if i:
+            yield b","
+        yield orjson.dumps(_run_fields(run, duration))
+    trailer = {"total": total, "page": page, "page_size": page_size, "next_cursor": next_cursor}
+    # Splice the trailer's fields onto the runs array: drop its opening brace
+    yield b"]," + orjson.dumps(trailer)[1:]
+
+
+def _parse_runs_cursor(cursor: str) -> tuple[date, int]:
+    """Split a ``<run_date>:<id>`` runs cursor into its keyset values."""
+    try:
+        run_date, run_id = cursor.split(":")
+        return date.fromisoformat(run_date), int(run_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {cursor}",
+        )
+
+
+def _json_response(payload: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a response schema with orjson, bypassing FastAPI's re-validation.
+
+    orjson encodes dates and datetimes natively, so a plain ``model_dump()`` suffices.
+    """
+    return Response(
+        content=orjson.dumps(payload.model_dump()),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _run_to_detail_response(run: IngestionRun) -> IngestionRunDetailResponse:
+    """Convert IngestionRun model, with loaded store statuses, to the detail schema."""
     duration = None
     if run.completed_at and run.started_at:
         duration = (run.completed_at - run.started_at).total_seconds()
 
-    return IngestionRunResponse(
-        id=run.id,
-        run_date=run.run_date,
-        status=run.status,
-        task_id=run.task_id,
-        trigger_type=run.trigger_type,
-        stores_total=run.stores_total,
-        stores_completed=run.stores_completed,
-        stores_failed=run.stores_failed,
-        products_updated=run.products_updated,
-        discounts_updated=run.discounts_updated,
-        error_message=run.error_message,
-        started_at=run.started_at,
-        completed_at=run.completed_at,
-        duration_seconds=duration,
+    return IngestionRunDetailResponse.model_construct(
+        **_run_fields(run, duration),
+        store_statuses=[
+            StoreIngestionStatusResponse.model_construct(
+                **dict(zip(_STORE_STATUS_FIELDS, _get_store_status_fields(s), strict=True))
+            )
+            for s in run.store_statuses
+        ],
     )
+
+
+def _run_fields(run: IngestionRun, duration_seconds: float | None) -> dict:
+    """Collect IngestionRunResponse field values from an IngestionRun row."""
+    fields = dict(zip(_RUN_FIELDS, _get_run_fields(run), strict=True))
+    fields["duration_seconds"] = duration_seconds
+    return fields
@@ -1,14 +1,19 @@
 """API routes for meal plan generation and management."""
 
+import asyncio
+import secrets
 import uuid
-from datetime import date
+from datetime import date, timedelta
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from foodplanner.database import get_db
 from foodplanner.graph.database import get_graph_db
@@ -16,12 +21,24 @@ from foodplanner.graph.service import GraphService
 from foodplanner.logging_config import get_logger
 from foodplanner.models import MealPlan, MealPlanRecipe, User
 from foodplanner.plan.optimizer import DietaryPreference, MealPlanOptimizer
-from foodplanner.plan.shopping_list import ShoppingListGenerator
+from foodplanner.plan.shopping_list import ShoppingItem, ShoppingListGenerator
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/meal-plans", tags=["meal-plans"])
 
+# Loader options for plans rendered with their recipes: eager-load the recipe rows
+# and raise on any other lazy load instead of issuing hidden per-row queries
+_PLAN_WITH_RECIPES = (
+    selectinload(MealPlan.recipes).selectinload(MealPlanRecipe.recipe),
+    raiseload("*"),
+)
+
+# Each optimizer run fans out several graph queries; cap concurrent runs so a burst of
+# plan requests queues here instead of exhausting the graph connection pool
+OPTIMIZER_CONCURRENCY = 8
+_optimizer_semaphore = asyncio.Semaphore(OPTIMIZER_CONCURRENCY)
+
 
 # =============================================================================
 # Request/Response Schemas
@@ -149,23 +166,91 @@ class ShoppingListResponse(BaseModel):
 # =============================================================================
 
 
-async def get_or_create_user(db: AsyncSession, user_id: str) -> User:
-    """Get existing user or create a placeholder."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        import secrets
-
-        user = User(
+async def ensure_user(db: AsyncSession, user_id: str) -> None:
+    """Create a placeholder user unless one already exists, in a single statement."""
+    await db.execute(
+        pg_insert(User)
+        .values(
             id=user_id,
             email=f"{user_id}@placeholder.local",
             hashed_password=secrets.token_hex(32),  # random unusable hash
         )
-        db.add(user)
-        await db.flush()
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+
+
+def _plan_to_response(plan: MealPlan) -> MealPlanResponse:
+    """Convert a MealPlan loaded with its recipes to the response schema.
+
+    Recipe entries come from ORM rows, so they skip validation.
+    """
+    metadata = plan.plan_metadata or {}
+    people_count = metadata.get("people_count", 2)
+
+    return MealPlanResponse(
+        id=plan.id,
+        user_id=plan.user_id,
+        start_date=plan.start_date,
+        end_date=plan.end_date,
+        people_count=people_count,
+        total_cost=plan.total_cost,
+        total_savings=metadata.get("total_savings", 0.0),
+        recipes=[
+            RecipeInPlan.model_construct(
+                id=mpr.recipe_id,
+                name=mpr.recipe.name if mpr.recipe else "Unknown",
+                thumbnail=None,
+                scheduled_date=mpr.scheduled_date,
+                meal_type=mpr.meal_type,
+                servings=people_count,
+                estimated_cost=None,
+                estimated_savings=None,
+                is_locked=False,
+            )
+            for mpr in plan.recipes
+        ],
+        created_at=plan.created_at.isoformat(),
+    )
+
+
+def _to_shopping_list_item(item: ShoppingItem) -> ShoppingListItem:
+    """Convert a generated shopping item to its response schema, skipping validation."""
+    return ShoppingListItem.model_construct(
+        ingredient_name=item.ingredient_name,
+        normalized_name=item.normalized_name,
+        quantity=item.quantity,
+        unit=item.unit,
+        recipe_sources=item.recipe_sources,
+        product_name=item.product_name,
+        product_id=item.product_id,
+        product_brand=item.product_brand,
+        price=item.price,
+        discount_price=item.discount_price,
+        store_id=item.store_id,
+        store_name=item.store_name,
+        category=item.category,
+        match_confidence=item.match_confidence,
+        alternative_products=item.alternative_products,
+    )
+
+
+def _empty_shopping_list(plan_id: str) -> ShoppingListResponse:
+    """Shopping list for a plan with nothing to aggregate."""
+    return ShoppingListResponse(
+        meal_plan_id=plan_id,
+        items=[],
+        total_cost=0.0,
+        total_savings=0.0,
+        matched_items_count=0,
+        unmatched_items_count=0,
+        items_by_category={},
+        items_by_store={},
+    )
 
-    return user
+
+def _json_response(payload: BaseModel) -> Response:
+    """Serialize a response schema with orjson, bypassing FastAPI's re-validation."""
+    return Response(content=orjson.dumps(payload.model_dump()), media_type="application/json")
 
 
 async def get_graph_service() -> GraphService:
@@ -191,8 +276,6 @@ async def create_meal_plan(
     optimized for cost savings using discounted products where possible.
     Uses the MealPlanOptimizer for intelligent recipe selection.
     """
-    from datetime import timedelta
-
     logger.info(
         f"Creating meal plan: {request.start_date} to {request.end_date}, "
         f"people={request.people_count}"
@@ -213,53 +296,56 @@ async def create_meal_plan(
         )
 
     # Ensure user exists
-    await get_or_create_user(db, request.user_id)
+    await ensure_user(db, request.user_id)
 
     # Convert dietary preferences to optimizer format
     dietary_prefs = [
         DietaryPreference(name=p.name, type=p.type) for p in request.dietary_preferences
     ]
 
+    # Both the optimizer and the fallback schedule one recipe per day from the start date
+    dates = [request.start_date + timedelta(days=i) for i in range(days_count)]
+
     # Use optimizer for intelligent recipe selection
     total_cost = 0.0
     total_savings = 0.0
     recipes_in_plan: list[RecipeInPlan] = []
+    graph_service: GraphService | None = None
 
     try:
         graph_service = await get_graph_service()
         optimizer = MealPlanOptimizer(graph_service)
 
-        optimized_recipes = await optimizer.optimize(
-            days=days_count,
-            people_count=request.people_count,
-            store_ids=request.store_ids if request.store_ids else None,
-            dietary_preferences=dietary_prefs if dietary_prefs else None,
-            budget_max=request.budget_max,
-            excluded_recipe_ids=None,
-        )
+        async with _optimizer_semaphore:
+            optimized_recipes = await optimizer.optimize(
+                days=days_count,
+                people_count=request.people_count,
+                store_ids=request.store_ids if request.store_ids else None,
+                dietary_preferences=dietary_prefs if dietary_prefs else None,
+                budget_max=request.budget_max,
+                excluded_recipe_ids=None,
+            )
 
         # Assign optimized recipes to days
-        for i, opt_recipe in enumerate(optimized_recipes):
-            scheduled_date = request.start_date + timedelta(days=i)
-
-            recipes_in_plan.append(
-                RecipeInPlan(
-                    id=opt_recipe.recipe_id,
-                    name=opt_recipe.recipe_name,
-                    thumbnail=opt_recipe.thumbnail,
-                    scheduled_date=scheduled_date,
-                    meal_type="dinner",
-                    servings=request.people_count,
-                    estimated_cost=opt_recipe.estimated_cost,
-                    estimated_savings=opt_recipe.estimated_savings,
-                    is_locked=False,
-                    suggestion_reason=opt_recipe.suggestion_reason,
-                    discounted_ingredients=opt_recipe.discounted_ingredients,
-                )
+        people_count = request.people_count
+        recipes_in_plan = [
+            RecipeInPlan.model_construct(
+                id=opt_recipe.recipe_id,
+                name=opt_recipe.recipe_name,
+                thumbnail=opt_recipe.thumbnail,
+                scheduled_date=dates[i],
+                meal_type="dinner",
+                servings=people_count,
+                estimated_cost=opt_recipe.estimated_cost,
+                estimated_savings=opt_recipe.estimated_savings,
+                is_locked=False,
+                suggestion_reason=opt_recipe.suggestion_reason,
+                discounted_ingredients=opt_recipe.discounted_ingredients,
             )
-
-            total_cost += opt_recipe.estimated_cost
-            total_savings += opt_recipe.estimated_savings
+            for i, opt_recipe in enumerate(optimized_recipes)
+        ]
+        total_cost = sum((opt_recipe.estimated_cost for opt_recipe in optimized_recipes), 0.0)
+        total_savings = sum((opt_recipe.estimated_savings for opt_recipe in optimized_recipes), 0.0)
 
         logger.info(f"Optimizer selected {len(optimized_recipes)} recipes")
 
@@ -267,17 +353,18 @@ async def create_meal_plan(
         logger.warning(f"Optimizer failed: {e}, falling back to simple selection")
         # Fallback to simple recipe selection if optimizer fails
         try:
-            graph_service = await get_graph_service()
+            # Reuse the optimizer's service unless obtaining it was what failed
+            if graph_service is None:
+                graph_service = await get_graph_service()
             recipes = await graph_service.search_recipes(limit=days_count)
 
             for i, recipe in enumerate(recipes):
-                scheduled_date = request.start_date + timedelta(days=i)
                 recipes_in_plan.append(
-                    RecipeInPlan(
+                    RecipeInPlan.model_construct(
                         id=recipe.id,
                         name=recipe.name,
                         thumbnail=recipe.thumbnail,
-                        scheduled_date=scheduled_date,
+                        scheduled_date=dates[i],
                         meal_type="dinner",
                         servings=request.people_count,
                         estimated_cost=None,
@@ -308,15 +395,20 @@ async def create_meal_plan(
     )
     db.add(meal_plan)
 
-    # Add meal plan recipes
-    for recipe_in_plan in recipes_in_plan:
-        meal_plan_recipe = MealPlanRecipe(
-            meal_plan_id=plan_id,
-            recipe_id=recipe_in_plan.id,
-            scheduled_date=recipe_in_plan.scheduled_date,
-            meal_type=recipe_in_plan.meal_type,
+    # Add meal plan recipes in one bulk INSERT (autoflushes the plan row first)
+    if recipes_in_plan:
+        await db.execute(
+            insert(MealPlanRecipe),
+            [
+                {
+                    "meal_plan_id": plan_id,
+                    "recipe_id": recipe_in_plan.id,
+                    "scheduled_date": recipe_in_plan.scheduled_date,
+                    "meal_type": recipe_in_plan.meal_type,
+                }
+                for recipe_in_plan in recipes_in_plan
+            ],
         )
-        db.add(meal_plan_recipe)
 
     await db.commit()
 
@@ -348,46 +440,14 @@ async def list_meal_plans(
     result = await db.execute(
         select(MealPlan)
         .where(MealPlan.user_id == user_id)
-        .options(selectinload(MealPlan.recipes))
+        .options(*_PLAN_WITH_RECIPES)
         .order_by(MealPlan.created_at.desc())
         .offset(offset)
         .limit(limit)
     )
     plans = result.scalars().all()
 
-    plan_responses = []
-    for plan in plans:
-        people_count = plan.plan_metadata.get("people_count", 2) if plan.plan_metadata else 2
-        total_savings = plan.plan_metadata.get("total_savings", 0.0) if plan.plan_metadata else 0.0
-
-        recipes_in_plan = [
-            RecipeInPlan(
-                id=mpr.recipe_id,
-                name=mpr.recipe.name if mpr.recipe else "Unknown",
-                thumbnail=None,
-                scheduled_date=mpr.scheduled_date,
-                meal_type=mpr.meal_type,
-                servings=people_count,
-                estimated_cost=None,
-                estimated_savings=None,
-                is_locked=False,
-            )
-            for mpr in plan.recipes
-        ]
-
-        plan_responses.append(
-            MealPlanResponse(
-                id=plan.id,
-                user_id=plan.user_id,
-                start_date=plan.start_date,
-                end_date=plan.end_date,
-                people_count=people_count,
-                total_cost=plan.total_cost,
-                total_savings=total_savings,
-                recipes=recipes_in_plan,
-                created_at=plan.created_at.isoformat(),
-            )
-        )
+    plan_responses = [_plan_to_response(plan) for plan in plans]
 
     return MealPlanListResponse(plans=plan_responses, total=len(plan_responses))
 
@@ -401,9 +461,7 @@ async def get_meal_plan(
     logger.info(f"Fetching meal plan {plan_id}")
 
     result = await db.execute(
-        select(MealPlan)
-        .where(MealPlan.id == plan_id)
-        .options(selectinload(MealPlan.recipes).selectinload(MealPlanRecipe.recipe))
+        select(MealPlan).where(MealPlan.id == plan_id).options(*_PLAN_WITH_RECIPES)
     )
     plan = result.scalar_one_or_none()
 
@@ -413,35 +471,7 @@ async def get_meal_plan(
             detail=f"Meal plan {plan_id} not found",
         )
 
-    people_count = plan.plan_metadata.get("people_count", 2) if plan.plan_metadata else 2
-    total_savings = plan.plan_metadata.get("total_savings", 0.0) if plan.plan_metadata else 0.0
-
-    recipes_in_plan = [
-        RecipeInPlan(
-            id=mpr.recipe_id,
-            name=mpr.recipe.name if mpr.recipe else "Unknown",
-            thumbnail=None,
-            scheduled_date=mpr.scheduled_date,
-            meal_type=mpr.meal_type,
-            servings=people_count,
-            estimated_cost=None,
-            estimated_savings=None,
-            is_locked=False,
-        )
-        for mpr in plan.recipes
-    ]
-
-    return MealPlanResponse(
-        id=plan.id,
-        user_id=plan.user_id,
-        start_date=plan.start_date,
-        end_date=plan.end_date,
-        people_count=people_count,
-        total_cost=plan.total_cost,
-        total_savings=total_savings,
-        recipes=recipes_in_plan,
-        created_at=plan.created_at.isoformat(),
-    )
+    return _plan_to_response(plan)
 
 
 @router.patch("/{plan_id}", response_model=MealPlanResponse)
@@ -458,9 +488,7 @@ async def update_meal_plan(
     logger.info(f"Updating meal plan {plan_id}")
 
     result = await db.execute(
-        select(MealPlan)
-        .where(MealPlan.id == plan_id)
-        .options(selectinload(MealPlan.recipes).selectinload(MealPlanRecipe.recipe))
+        select(MealPlan).where(MealPlan.id == plan_id).options(*_PLAN_WITH_RECIPES)
     )
     plan = result.scalar_one_or_none()
 
@@ -471,16 +499,13 @@ async def update_meal_plan(
         )
 
     if request.meals:
+        # Index existing meals by slot once; first match wins, as with a linear scan
+        slots: dict[tuple[date, str], MealPlanRecipe] = {}
+        for mpr in plan.recipes:
+            slots.setdefault((mpr.scheduled_date, mpr.meal_type), mpr)
+
         for meal_update in request.meals:
-            # Find existing meal for this date/type
-            existing = None
-            for mpr in plan.recipes:
-                if (
-                    mpr.scheduled_date == meal_update.scheduled_date
-                    and mpr.meal_type == meal_update.meal_type
-                ):
-                    existing = mpr
-                    break
+            existing = slots.get((meal_update.scheduled_date, meal_update.meal_type))
 
             if meal_update.recipe_id is None:
                 # Remove meal
@@ -500,45 +525,18 @@ async def update_meal_plan(
                 db.add(new_mpr)
 
     await db.commit()
-    await db.refresh(plan)
 
-    # Re-fetch with updated data
+    # Re-fetch with updated data; the session keeps loaded state across commits
+    # (expire_on_commit=False), so overwrite the stale collection in place
     result = await db.execute(
         select(MealPlan)
         .where(MealPlan.id == plan_id)
-        .options(selectinload(MealPlan.recipes).selectinload(MealPlanRecipe.recipe))
+        .options(*_PLAN_WITH_RECIPES)
+        .execution_options(populate_existing=True)
     )
     plan = result.scalar_one()
 
-    people_count = plan.plan_metadata.get("people_count", 2) if plan.plan_metadata else 2
-    total_savings = plan.plan_metadata.get("total_savings", 0.0) if plan.plan_metadata else 0.0
-
-    recipes_in_plan = [
-        RecipeInPlan(
-            id=mpr.recipe_id,
-            name=mpr.recipe.name if mpr.recipe else "Unknown",
-            thumbnail=None,
-            scheduled_date=mpr.scheduled_date,
-            meal_type=mpr.meal_type,
-            servings=people_count,
-            estimated_cost=None,
-            estimated_savings=None,
-            is_locked=False,
-        )
-        for mpr in plan.recipes
-    ]
-
-    return MealPlanResponse(
-        id=plan.id,
-        user_id=plan.user_id,
-        start_date=plan.start_date,
-        end_date=plan.end_date,
-        people_count=people_count,
-        total_cost=plan.total_cost,
-        total_savings=total_savings,
-        recipes=recipes_in_plan,
-        created_at=plan.created_at.isoformat(),
-    )
+    return _plan_to_response(plan)
 
 
 @router.delete("/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -549,16 +547,17 @@ async def delete_meal_plan(
     """Delete a meal plan."""
     logger.info(f"Deleting meal plan {plan_id}")
 
-    result = await db.execute(select(MealPlan).where(MealPlan.id == plan_id))
-    plan = result.scalar_one_or_none()
+    # Delete in SQL without loading the plan. meal_plan_recipes cascades on delete,
+    # but tables created before that FK option lack it, so clear the rows explicitly.
+    await db.execute(delete(MealPlanRecipe).where(MealPlanRecipe.meal_plan_id == plan_id))
+    result = await db.execute(delete(MealPlan).where(MealPlan.id == plan_id))
 
-    if not plan:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Meal plan {plan_id} not found",
         )
 
-    await db.delete(plan)
     await db.commit()
 
 
@@ -566,7 +565,7 @@ async def delete_meal_plan(
 async def get_shopping_list(
     plan_id: str,
     db: AsyncSession = Depends(get_db),
-) -> ShoppingListResponse:
+) -> Response:
     """
     Get aggregated shopping list for a meal plan.
 
@@ -576,9 +575,7 @@ async def get_shopping_list(
     logger.info(f"Generating shopping list for plan {plan_id}")
 
     result = await db.execute(
-        select(MealPlan)
-        .where(MealPlan.id == plan_id)
-        .options(selectinload(MealPlan.recipes).selectinload(MealPlanRecipe.recipe))
+        select(MealPlan).where(MealPlan.id == plan_id).options(*_PLAN_WITH_RECIPES)
     )
     plan = result.scalar_one_or_none()
 
@@ -588,6 +585,10 @@ async def get_shopping_list(
             detail=f"Meal plan {plan_id} not found",
         )
 
+    # Nothing to aggregate; skip the graph round trip entirely
+    if not plan.recipes:
+        return _json_response(_empty_shopping_list(plan_id))
+
     # Get store IDs from plan metadata
     store_ids = None
     if plan.plan_metadata:
@@ -599,97 +600,33 @@ async def get_shopping_list(
         generator = ShoppingListGenerator(graph_service)
         shopping_list = await generator.generate_from_db_plan(plan, store_ids)
 
-        # Convert to response format
-        items = [
-            ShoppingListItem(
-                ingredient_name=item.ingredient_name,
-                normalized_name=item.normalized_name,
-                quantity=item.quantity,
-                unit=item.unit,
-                recipe_sources=item.recipe_sources,
-                product_name=item.product_name,
-                product_id=item.product_id,
-                product_brand=item.product_brand,
-                price=item.price,
-                discount_price=item.discount_price,
-                store_id=item.store_id,
-                store_name=item.store_name,
-                category=item.category,
-                match_confidence=item.match_confidence,
-                alternative_products=item.alternative_products,
+        # Convert each item once; the grouped views hold the same item objects
+        converted = {id(item): _to_shopping_list_item(item) for item in shopping_list.items}
+        items = list(converted.values())
+        items_by_category = {
+            cat: [converted[id(item)] for item in cat_items]
+            for cat, cat_items in shopping_list.items_by_category.items()
+        }
+        items_by_store = {
+            store: [converted[id(item)] for item in store_items]
+            for store, store_items in shopping_list.items_by_store.items()
+        }
+
+        # Lists can run to hundreds of items; skip output validation and encode with orjson
+        return _json_response(
+            ShoppingListResponse.model_construct(
+                meal_plan_id=plan_id,
+                items=items,
+                total_cost=shopping_list.total_cost,
+                total_savings=shopping_list.total_savings,
+                matched_items_count=shopping_list.matched_items_count,
+                unmatched_items_count=shopping_list.unmatched_items_count,
+                items_by_category=items_by_category,
+                items_by_store=items_by_store,
             )
-            for item in shopping_list.items
-        ]
-
-        # Convert category grouping
-        items_by_category: dict[str, list[ShoppingListItem]] = {}
-        for cat, cat_items in shopping_list.items_by_category.items():
-            items_by_category[cat] = [
-                ShoppingListItem(
-                    ingredient_name=item.ingredient_name,
-                    normalized_name=item.normalized_name,
-                    quantity=item.quantity,
-                    unit=item.unit,
-                    recipe_sources=item.recipe_sources,
-                    product_name=item.product_name,
-                    product_id=item.product_id,
-                    product_brand=item.product_brand,
-                    price=item.price,
-                    discount_price=item.discount_price,
-                    store_id=item.store_id,
-                    store_name=item.store_name,
-                    category=item.category,
-                    match_confidence=item.match_confidence,
-                    alternative_products=item.alternative_products,
-                )
-                for item in cat_items
-            ]
-
-        # Convert store grouping
-        items_by_store: dict[str, list[ShoppingListItem]] = {}
-        for store, store_items in shopping_list.items_by_store.items():
-            items_by_store[store] = [
-                ShoppingListItem(
-                    ingredient_name=item.ingredient_name,
-                    normalized_name=item.normalized_name,
-                    quantity=item.quantity,
-                    unit=item.unit,
-                    recipe_sources=item.recipe_sources,
-                    product_name=item.product_name,
-                    product_id=item.product_id,
-                    product_brand=item.product_brand,
-                    price=item.price,
-                    discount_price=item.discount_price,
-                    store_id=item.store_id,
-                    store_name=item.store_name,
-                    category=item.category,
-                    match_confidence=item.match_confidence,
-                    alternative_products=item.alternative_products,
-                )
-                for item in store_items
-            ]
-
-        return ShoppingListResponse(
-            meal_plan_id=plan_id,
-            items=items,
-            total_cost=shopping_list.total_cost,
-            total_savings=shopping_list.total_savings,
-            matched_items_count=shopping_list.matched_items_count,
-            unmatched_items_count=shopping_list.unmatched_items_count,
-            items_by_category=items_by_category,
-            items_by_store=items_by_store,
         )
 
     except Exception as e:
         logger.error(f"Shopping list generation failed: {e}")
         # Fallback to basic list without aggregation
-        return ShoppingListResponse(
-            meal_plan_id=plan_id,
-            items=[],
-            total_cost=0.0,
-            total_savings=0.0,
-            matched_items_count=0,
-            unmatched_items_count=0,
-            items_by_category={},
-            items_by_store={},
-        )
+        return _json_response(_empty_shopping_list(plan_id))
@@ -1,8 +1,12 @@
 """API routes for recipes and ingredients from the knowledge graph."""
 
-from typing import Annotated, Any
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated, Any, Literal
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from foodplanner.graph.database import get_graph_db
@@ -127,6 +131,12 @@ class IngredientMatchResponse(BaseModel):
     total: int
 
 
+class IngredientMatchBatchRequest(BaseModel):
+    """Request to match several ingredients to products in one call."""
+
+    items: list[IngredientMatchRequest] = Field(min_length=1, max_length=100)
+
+
 # Dependency to get graph service
 async def get_graph_service() -> GraphService:
     """Get graph service instance."""
@@ -161,18 +171,27 @@ async def list_recipes(
     )
 
     try:
-        recipes = await service.search_recipes(
-            name=name,
-            category=category,
-            area=area,
-            ingredient=ingredient,
-            limit=limit,
-            offset=offset,
+        # Each query runs in its own graph session, so page and count go out together
+        recipes, total = await asyncio.gather(
+            service.search_recipes(
+                name=name,
+                category=category,
+                area=area,
+                ingredient=ingredient,
+                limit=limit,
+                offset=offset,
+            ),
+            service.count_recipes(
+                name=name,
+                category=category,
+                area=area,
+                ingredient=ingredient,
+            ),
         )
 
         return RecipeListResponse(
             recipes=recipes,
-            total=len(recipes),  # Would need separate count query for accurate total
+            total=total,
             offset=offset,
             limit=limit,
         )
@@ -322,10 +341,25 @@ async def delete_recipe(
 @router.get("/ingredients", response_model=IngredientListResponse)
 async def list_ingredients(
     limit: Annotated[int, Query(ge=1, le=1000, description="Max ingredients to return")] = 100,
+    output_format: Annotated[
+        Literal["json", "ndjson"],
+        Query(alias="format", description="json, or ndjson to stream one ingredient per line"),
+    ] = "json",
     service: GraphService = Depends(get_graph_service),
-) -> IngredientListResponse:
-    """List all ingredients in the knowledge graph."""
-    logger.info(f"Listing ingredients: limit={limit}")
+) -> IngredientListResponse | StreamingResponse:
+    """
+    List all ingredients in the knowledge graph.
+
+    With ``format=ndjson`` the ingredients are streamed as they are read from the
+    graph, one JSON object per line, instead of being buffered into one response.
+    """
+    logger.info(f"Listing ingredients: limit={limit}, format={output_format}")
+
+    if output_format == "ndjson":
+        return StreamingResponse(
+            _stream_ingredients_ndjson(service, limit),
+            media_type="application/x-ndjson",
+        )
 
     try:
         ingredients = await service.get_all_ingredients(limit=limit)
@@ -342,6 +376,17 @@ async def list_ingredients(
         )
 
 
+async def _stream_ingredients_ndjson(service: GraphService, limit: int) -> AsyncIterator[bytes]:
+    """Yield one serialized ingredient per line."""
+    try:
+        async for ingredient in service.stream_all_ingredients(limit):
+            yield orjson.dumps(ingredient.model_dump()) + b"\n"
+    except Exception as e:
+        # Headers are already sent, so the truncated stream is the only error signal
+        logger.error(f"Failed to stream ingredients: {e}")
+        raise
+
+
 @router.get("/ingredients/unmatched")
 async def get_unmatched_ingredients(
     limit: Annotated[int, Query(ge=1, le=500, description="Max results")] = 100,
@@ -386,14 +431,14 @@ async def get_ingredient_products(
     )
 
     try:
-        # Get ingredient details
-        ingredient = await service.get_ingredient(ingredient_name)
-
-        # Get matched products
-        products = await service.get_products_for_ingredient(
-            ingredient_name,
-            min_confidence=min_confidence,
-            limit=limit,
+        # Ingredient details and matched products are independent queries
+        ingredient, products = await asyncio.gather(
+            service.get_ingredient(ingredient_name),
+            service.get_products_for_ingredient(
+                ingredient_name,
+                min_confidence=min_confidence,
+                limit=limit,
+            ),
         )
 
         return IngredientResponse(
@@ -425,38 +470,90 @@ async def match_ingredient(
         f"top_k={request.top_k}, min_confidence={request.min_confidence}"
     )
 
+    try:
+        return await _coalesced_match(request)
+    except Exception as e:
+        logger.error(f"Failed to match ingredient {request.ingredient_name}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to match ingredient",
+        )
+
+
+@router.post("/ingredients/match/batch", response_model=list[IngredientMatchResponse])
+async def match_ingredients_batch(
+    request: IngredientMatchBatchRequest,
+) -> list[IngredientMatchResponse]:
+    """
+    Find matching products for several ingredients at once.
+
+    All items share one matcher, so the product catalogue is loaded from the
+    graph once per call instead of once per ingredient.
+    """
+    logger.info(f"Matching {len(request.items)} ingredients")
+
     try:
         db = await get_graph_db()
         matcher = IngredientMatcher(db)
 
-        matches = await matcher.find_matches(
-            ingredient_name=request.ingredient_name,
-            top_k=request.top_k,
-            min_confidence=request.min_confidence,
-        )
-
-        return IngredientMatchResponse(
-            ingredient_name=request.ingredient_name,
-            matches=[
-                {
-                    "product_id": m.product_id,
-                    "product_name": m.product_name,
-                    "confidence_score": m.confidence_score,
-                    "match_type": m.match_type,
-                    "matched_term": m.matched_term,
-                }
-                for m in matches
-            ],
-            total=len(matches),
-        )
+        return [await _match_ingredient(matcher, item) for item in request.items]
     except Exception as e:
-        logger.error(f"Failed to match ingredient {request.ingredient_name}: {e}")
+        logger.error(f"Failed to match ingredient batch: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to match ingredient",
+            detail="Failed to match ingredients",
         )
 
 
+# Live match runs in flight, keyed by (ingredient_name, top_k, min_confidence), so
+# identical concurrent requests share one matcher run instead of each loading products
+_inflight_matches: dict[tuple[str, int, float], asyncio.Task[IngredientMatchResponse]] = {}
+
+
+async def _coalesced_match(request: IngredientMatchRequest) -> IngredientMatchResponse:
+    """Match one ingredient, joining an identical run that is already in flight."""
+    key = (request.ingredient_name, request.top_k, request.min_confidence)
+    task = _inflight_matches.get(key)
+    if task is None:
+        task = asyncio.create_task(_match_with_new_matcher(request))
+        _inflight_matches[key] = task
+        task.add_done_callback(lambda _: _inflight_matches.pop(key, None))
+    # Shielded so one caller disconnecting doesn't cancel the run for the others
+    return await asyncio.shield(task)
+
+
+async def _match_with_new_matcher(request: IngredientMatchRequest) -> IngredientMatchResponse:
+    """Run a live match with its own matcher."""
+    db = await get_graph_db()
+    return await _match_ingredient(IngredientMatcher(db), request)
+
+
+async def _match_ingredient(
+    matcher: IngredientMatcher, request: IngredientMatchRequest
+) -> IngredientMatchResponse:
+    """Run the matcher for one request and shape the response."""
+    matches = await matcher.find_matches(
+        ingredient_name=request.ingredient_name,
+        top_k=request.top_k,
+        min_confidence=request.min_confidence,
+    )
+
+    return IngredientMatchResponse(
+        ingredient_name=request.ingredient_name,
+        matches=[
+            {
+                "product_id": m.product_id,
+                "product_name": m.product_name,
+                "confidence_score": m.confidence_score,
+                "match_type": m.match_type,
+                "matched_term": m.matched_term,
+            }
+            for m in matches
+        ],
+        total=len(matches),
+    )
+
+
 # =============================================================================
 # Category and Area Endpoints
 # =============================================================================
@@ -538,7 +635,11 @@ async def get_graph_stats(
         )
 
 
-@router.post("/graph/ingest/mealdb", response_model=TaskTriggerResponse)
+@router.post(
+    "/graph/ingest/mealdb",
+    response_model=TaskTriggerResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_mealdb_ingestion() -> TaskTriggerResponse:
     """
     Trigger MealDB recipe ingestion task.
@@ -564,7 +665,11 @@ async def trigger_mealdb_ingestion() -> TaskTriggerResponse:
         )
 
 
-@router.post("/graph/sync/products", response_model=TaskTriggerResponse)
+@router.post(
+    "/graph/sync/products",
+    response_model=TaskTriggerResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_product_sync() -> TaskTriggerResponse:
     """
     Trigger product sync from PostgreSQL to Neo4j.
@@ -589,7 +694,11 @@ async def trigger_product_sync() -> TaskTriggerResponse:
         )
 
 
-@router.post("/graph/compute-matches", response_model=TaskTriggerResponse)
+@router.post(
+    "/graph/compute-matches",
+    response_model=TaskTriggerResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_ingredient_matching(
     min_confidence: Annotated[
         float, Query(ge=0.0, le=1.0, description="Minimum confidence to store")
@@ -619,12 +728,16 @@ async def trigger_ingredient_matching(
         )
 
 
-@router.post("/graph/refresh", response_model=TaskTriggerResponse)
+@router.post(
+    "/graph/refresh",
+    response_model=TaskTriggerResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_full_refresh() -> TaskTriggerResponse:
     """
     Trigger a full knowledge graph refresh.
 
-    This runs MealDB ingestion, product sync, and ingredient matching in sequence.
+    This runs MealDB ingestion and product sync concurrently, then ingredient matching.
     Useful for initial setup or periodic full refresh.
     """
     logger.info("Triggering full graph refresh task")
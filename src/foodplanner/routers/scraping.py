@@ -4,16 +4,24 @@ Provides endpoints to trigger, monitor, and cancel scraping jobs
 for grocery store product data.
 """
 
-from datetime import datetime
+import asyncio
+import math
+import time
+from datetime import UTC, datetime
 
+import orjson
+from celery.result import AsyncResult
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from foodplanner.config import get_settings
 from foodplanner.logging_config import get_logger
 from foodplanner.tasks.scraping import (
     cancel_scrape,
     full_rema1000_scrape_task,
     get_active_scrape,
+    get_active_scrape_with_progress,
     get_progress,
 )
 
@@ -21,6 +29,14 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/scrape", tags=["scraping"])
 
+REMA1000_WEBSITE = "https://shop.rema1000.dk"
+
+# Seconds a scraper health result is reused, so load balancer probes don't each
+# send a page load to the shop
+SCRAPER_HEALTH_TTL = 10.0
+_scraper_health_cache: dict[str, tuple[float, dict]] = {}
+_scraper_health_lock = asyncio.Lock()
+
 
 # Request/Response schemas
 class ScrapeJobRequest(BaseModel):
@@ -111,10 +127,22 @@ AVAILABLE_CATEGORIES = [
     {"slug": "kiosk", "name": "Kiosk"},
 ]
 
+# The category list is static: validate against a prebuilt slug set and serve the
+# listing from bytes encoded once at import
+_VALID_SLUGS = frozenset(cat["slug"] for cat in AVAILABLE_CATEGORIES)
+_CATEGORIES_BODY = orjson.dumps(
+    {"categories": AVAILABLE_CATEGORIES, "total": len(AVAILABLE_CATEGORIES)}
+)
 
-@router.post("/rema1000/full", response_model=ScrapeJobResponse)
+
+@router.post(
+    "/rema1000/full",
+    response_model=ScrapeJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_full_rema1000_scrape(
     request: ScrapeJobRequest,
+    response: Response,
 ) -> ScrapeJobResponse:
     """
     Trigger a full product scrape for REMA 1000.
@@ -128,7 +156,8 @@ async def trigger_full_rema1000_scrape(
     - Optional full product details (description, nutrition, ingredients)
     - Anti-blocking measures (randomized delays, user-agent rotation)
 
-    Use the returned task_id to monitor progress via /status/{task_id}.
+    Use the returned task_id, or the Location header, to monitor progress
+    via /status/{task_id}.
     """
     # Check if another scrape is already running
     active = get_active_scrape()
@@ -142,13 +171,12 @@ async def trigger_full_rema1000_scrape(
 
     # Validate categories if provided
     if request.categories:
-        valid_slugs = {cat["slug"] for cat in AVAILABLE_CATEGORIES}
-        invalid = [c for c in request.categories if c not in valid_slugs]
+        invalid = [c for c in request.categories if c not in _VALID_SLUGS]
         if invalid:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid category slugs: {invalid}. "
-                f"Valid options: {sorted(valid_slugs)}",
+                f"Valid options: {sorted(_VALID_SLUGS)}",
             )
 
     logger.info(
@@ -167,13 +195,16 @@ async def trigger_full_rema1000_scrape(
             dry_run=request.dry_run,
         )
 
-        # Estimate duration based on settings
+        # Estimate duration based on settings; parallel lanes each take a share of the categories
         num_categories = len(request.categories) if request.categories else 16
+        concurrency = max(1, get_settings().full_scrape_category_concurrency)
+        rounds = math.ceil(num_categories / concurrency)
         if request.include_details:
-            estimated = f"{num_categories * 15}-{num_categories * 30} minutes"
+            estimated = f"{rounds * 15}-{rounds * 30} minutes"
         else:
-            estimated = f"{num_categories * 2}-{num_categories * 5} minutes"
+            estimated = f"{rounds * 2}-{rounds * 5} minutes"
 
+        response.headers["Location"] = router.url_path_for("get_scrape_status", task_id=task.id)
         return ScrapeJobResponse(
             task_id=task.id,
             status="queued",
@@ -190,7 +221,7 @@ async def trigger_full_rema1000_scrape(
 
 
 @router.get("/rema1000/status/{task_id}", response_model=ScrapeStatusResponse)
-async def get_scrape_status(task_id: str) -> ScrapeStatusResponse:
+async def get_scrape_status(task_id: str, response: Response) -> ScrapeStatusResponse:
     """
     Get the current status of a scraping job.
 
@@ -200,12 +231,15 @@ async def get_scrape_status(task_id: str) -> ScrapeStatusResponse:
     - Any errors encountered
     - Timestamps for started/updated/completed
     """
+    # Status changes between polls; keep browsers and proxies from replaying it
+    response.headers["Cache-Control"] = "no-store"
+
+    # Progress is the common case and a single Redis GET. The Celery result backend
+    # is a round trip too, so it is only consulted when no progress was recorded.
     progress = get_progress(task_id)
 
     if not progress:
         # Check if task exists in Celery
-        from celery.result import AsyncResult
-
         result = AsyncResult(task_id)
         if result.state == "PENDING":
             return ScrapeStatusResponse(
@@ -288,12 +322,11 @@ async def get_active_rema1000_scrape() -> ActiveScrapeResponse:
 
     Returns the task ID and status if a scrape is currently active.
     """
-    active_task_id = get_active_scrape()
+    active_task_id, progress = get_active_scrape_with_progress()
 
     if not active_task_id:
         return ActiveScrapeResponse(active=False)
 
-    progress = get_progress(active_task_id)
     if progress:
         status_response = ScrapeStatusResponse(
             task_id=progress.get("task_id", active_task_id),
@@ -320,17 +353,14 @@ async def get_active_rema1000_scrape() -> ActiveScrapeResponse:
 
 
 @router.get("/rema1000/categories")
-async def list_rema1000_categories() -> dict:
+async def list_rema1000_categories() -> Response:
     """
     List available REMA 1000 categories.
 
     Returns category slugs and names that can be used when triggering
     a targeted scrape of specific categories.
     """
-    return {
-        "categories": AVAILABLE_CATEGORIES,
-        "total": len(AVAILABLE_CATEGORIES),
-    }
+    return Response(content=_CATEGORIES_BODY, media_type="application/json")
 
 
 @router.get("/rema1000/health")
@@ -338,24 +368,39 @@ async def check_rema1000_scraper_health() -> dict:
     """
     Check if the REMA 1000 scraper can reach the website.
 
-    Performs a quick health check by attempting to load the homepage.
+    Performs a quick health check by attempting to load the homepage in a shared,
+    long-lived browser. Results are reused for SCRAPER_HEALTH_TTL seconds and
+    concurrent probes wait for the one in-flight check.
     """
-    from foodplanner.ingest.scrapers.rema1000 import Rema1000Scraper
+    async with _scraper_health_lock:
+        cached = _scraper_health_cache.get("result")
+        if cached is not None and cached[0] >= time.monotonic():
+            return cached[1]
+
+        result = await _run_scraper_health_check()
+        _scraper_health_cache["result"] = (time.monotonic() + SCRAPER_HEALTH_TTL, result)
+        return result
+
+
+async def _run_scraper_health_check() -> dict:
+    """Load the REMA 1000 homepage with the shared scraper and report the outcome."""
+    # Imported here so the API only loads Playwright once a health check is requested
+    from foodplanner.ingest.scrapers.rema1000 import get_health_scraper
 
     try:
-        async with Rema1000Scraper(headless=True) as scraper:
-            is_healthy = await scraper.health_check()
+        scraper = await get_health_scraper()
+        is_healthy = await scraper.health_check()
 
         return {
             "healthy": is_healthy,
-            "website": "https://shop.rema1000.dk",
-            "checked_at": datetime.utcnow().isoformat(),
+            "website": REMA1000_WEBSITE,
+            "checked_at": datetime.now(UTC).isoformat(),
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return {
             "healthy": False,
-            "website": "https://shop.rema1000.dk",
+            "website": REMA1000_WEBSITE,
             "error": str(e),
-            "checked_at": datetime.utcnow().isoformat(),
+            "checked_at": datetime.now(UTC).isoformat(),
         }
@@ -1,5 +1,6 @@
 """API routes for store discovery and user store preferences."""
 
+import secrets
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -209,8 +210,6 @@ async def add_user_store_preference(
     # Ensure user exists (create placeholder if not)
     user_result = await db.execute(select(User).where(User.id == user_id))
     if not user_result.scalar_one_or_none():
-        import secrets
-
         # Create placeholder user - in production, this would come from auth
         user = User(
             id=user_id,
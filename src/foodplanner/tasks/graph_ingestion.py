@@ -517,6 +517,16 @@ def compute_ingredient_matches_task(
             raise
 
 
+async def _ingest_mealdb_and_sync_products() -> list[dict[str, Any]]:
+    """
+    Run MealDB ingestion and product sync concurrently.
+
+    They write disjoint parts of the graph (recipes vs. stores and products) and
+    each reports its own failures in its result, so neither can abort the other.
+    """
+    return await asyncio.gather(_ingest_mealdb_recipes(), _sync_products_to_graph())
+
+
 @celery_app.task(
     bind=True,
     name="foodplanner.tasks.graph_ingestion.full_graph_refresh_task",
@@ -528,8 +538,8 @@ def full_graph_refresh_task(self) -> dict[str, Any]:
     """
     Full refresh of the knowledge graph.
 
-    This chains the MealDB ingestion and product sync tasks together.
-    Useful for initial setup or periodic full refresh.
+    MealDB ingestion and product sync run concurrently, then ingredient
+    matching runs over the result. Useful for initial setup or periodic full refresh.
 
     Returns:
         dict with combined results from both tasks.
@@ -547,15 +557,13 @@ def full_graph_refresh_task(self) -> dict[str, Any]:
         }
 
         try:
-            # Step 1: Ingest MealDB recipes
-            logger.info("Step 1: Ingesting MealDB recipes")
-            results["mealdb_ingestion"] = run_async(_ingest_mealdb_recipes())
-
-            # Step 2: Sync products from PostgreSQL
-            logger.info("Step 2: Syncing products to graph")
-            results["product_sync"] = run_async(_sync_products_to_graph())
+            # Steps 1 and 2: Ingest MealDB recipes and sync products from PostgreSQL
+            logger.info("Steps 1-2: Ingesting MealDB recipes and syncing products to graph")
+            results["mealdb_ingestion"], results["product_sync"] = run_async(
+                _ingest_mealdb_and_sync_products()
+            )
 
-            # Step 3: Compute ingredient matches
+            # Step 3: Compute ingredient matches (needs both recipes and products)
             logger.info("Step 3: Computing ingredient matches")
             results["ingredient_matching"] = run_async(_compute_ingredient_matches())
 
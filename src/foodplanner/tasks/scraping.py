@@ -5,6 +5,7 @@ Tasks include progress tracking via Redis and support for checkpointing/resumpti
 """
 
 import asyncio
+import functools
 import json
 from datetime import datetime
 from typing import Any
@@ -24,6 +25,16 @@ SCRAPE_PROGRESS_KEY = "scrape:rema1000:progress:{task_id}"
 SCRAPE_CHECKPOINT_KEY = "scrape:rema1000:checkpoint:{task_id}"
 ACTIVE_SCRAPE_KEY = "scrape:rema1000:active"
 
+# Reads the active task ID and its progress in one round trip. The progress key is
+# derived from the task ID, so it is built inside the script from the ARGV prefix.
+_ACTIVE_WITH_PROGRESS_SCRIPT = """
+local task_id = redis.call('GET', KEYS[1])
+if not task_id then
+    return nil
+end
+return {task_id, redis.call('GET', ARGV[1] .. task_id)}
+"""
+
 
 def run_async(coro: Any) -> Any:
     """Run an async coroutine in a synchronous context."""
@@ -40,8 +51,13 @@ def run_async(coro: Any) -> Any:
         return asyncio.run(coro)
 
 
+@functools.cache
 def get_redis_client():
-    """Get Redis client for progress tracking."""
+    """Get Redis client for progress tracking.
+
+    The client (and its connection pool) is shared per process; redis-py resets
+    the pool after a fork, so this is safe in prefork Celery workers.
+    """
     import redis
 
     from foodplanner.config import get_settings
@@ -139,6 +155,27 @@ def get_active_scrape() -> str | None:
     return task_id.decode() if task_id else None
 
 
+def get_active_scrape_with_progress() -> tuple[str | None, dict[str, Any] | None]:
+    """Get the active scrape task ID together with its progress.
+
+    Returns:
+        Tuple of (task ID, progress dictionary); either may be None.
+    """
+    redis_client = get_redis_client()
+    script = redis_client.register_script(_ACTIVE_WITH_PROGRESS_SCRIPT)
+    result = script(
+        keys=[ACTIVE_SCRAPE_KEY],
+        args=[SCRAPE_PROGRESS_KEY.format(task_id="")],
+    )
+    if not result:
+        return None, None
+
+    # A missing progress key comes back as a nil that truncates the Lua table
+    task_id = result[0].decode()
+    progress = json.loads(result[1]) if len(result) > 1 and result[1] else None
+    return task_id, progress
+
+
 def clear_active_scrape(task_id: str) -> None:
     """Clear active scrape if it matches the given task ID.
 
@@ -356,6 +393,7 @@ async def _execute_full_scrape(
         detail_max_delay=3.0,
         max_consecutive_errors=settings.full_scrape_max_retries,
         backoff_factor=settings.full_scrape_backoff_factor,
+        category_concurrency=settings.full_scrape_category_concurrency,
     )
 
     try:
@@ -432,52 +470,33 @@ def _save_product_batch(products: list[dict[str, Any]], store_id: str) -> int:
     """
     from datetime import datetime
 
-    from sqlalchemy.dialects.postgresql import insert
     from sqlalchemy.orm import Session
 
     from foodplanner.database import sync_engine
-    from foodplanner.models import Product
-
-    saved = 0
+    from foodplanner.ingest.batch_ingest import upsert_product_rows
+
+    last_updated = datetime.utcnow()
+    rows = [
+        {
+            "id": product.get("id") or str(hash(product.get("name", ""))),
+            "store_id": store_id,
+            "name": product.get("name", "Unknown"),
+            "price": product.get("price", 0.0),
+            "unit": product.get("unit") or "unit",
+            "ean": product.get("ean"),
+            "category": product.get("category"),
+            "brand": product.get("brand"),
+            "image_url": product.get("image_url"),
+            "description": product.get("description"),
+            "origin": product.get("origin"),
+            "nutrition": product.get("nutrition_info") or {},
+            "last_updated": last_updated,
+        }
+        for product in products
+    ]
 
     with Session(sync_engine) as session:
-        for product in products:
-            product_id = product.get("id") or str(hash(product.get("name", "")))
-
-            stmt = insert(Product).values(
-                id=product_id,
-                store_id=store_id,
-                name=product.get("name", "Unknown"),
-                price=product.get("price", 0.0),
-                unit=product.get("unit") or "unit",
-                ean=product.get("ean"),
-                category=product.get("category"),
-                brand=product.get("brand"),
-                image_url=product.get("image_url"),
-                description=product.get("description"),
-                origin=product.get("origin"),
-                nutrition=product.get("nutrition_info") or {},
-                last_updated=datetime.utcnow(),
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["id"],
-                set_={
-                    "name": stmt.excluded.name,
-                    "price": stmt.excluded.price,
-                    "unit": stmt.excluded.unit,
-                    "ean": stmt.excluded.ean,
-                    "category": stmt.excluded.category,
-                    "brand": stmt.excluded.brand,
-                    "image_url": stmt.excluded.image_url,
-                    "description": stmt.excluded.description,
-                    "origin": stmt.excluded.origin,
-                    "nutrition": stmt.excluded.nutrition,
-                    "last_updated": stmt.excluded.last_updated,
-                },
-            )
-            session.execute(stmt)
-            saved += 1
-
+        saved = upsert_product_rows(session, rows)
         session.commit()
 
     return saved
@@ -251,6 +251,25 @@ class TestResponseModels:
         assert recipe.category == "Chicken"
         assert len(recipe.ingredients) == 2
 
+    def test_recipe_ingredient_names_lower(self):
+        """Test normalized ingredient names are precomputed and excluded from dumps."""
+        recipe = RecipeWithIngredients(
+            id="52772",
+            name="Teriyaki Chicken",
+            instructions="Cook...",
+            thumbnail=None,
+            source_url=None,
+            youtube_url=None,
+            tags=[],
+            ingredients=[{"name": "Chicken"}, {"name": "Soy Sauce"}, {"quantity": "1"}],
+        )
+
+        assert recipe.ingredient_names_lower == frozenset({"chicken", "soy sauce", ""})
+        assert recipe.ingredient_names_lower is recipe.ingredient_names_lower
+        assert sorted(recipe.ingredient_text_lower.split("\n")) == ["", "chicken", "soy sauce"]
+        assert "ingredient_names_lower" not in recipe.model_dump()
+        assert "ingredient_text_lower" not in recipe.model_dump()
+
     def test_recipe_search_result(self):
         """Test RecipeSearchResult model."""
         recipe = RecipeWithIngredients(
@@ -0,0 +1,143 @@
+"""Tests for GraphService recipe cost and search memoization."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from foodplanner.graph import service as graph_service_module
+from foodplanner.graph.service import GraphService, invalidate_recipe_caches
+
+
+@pytest.fixture
+def service():
+    """GraphService with a mocked repository and empty recipe caches."""
+    invalidate_recipe_caches()
+    svc = GraphService(MagicMock())
+    svc.repo = AsyncMock()
+    svc.repo.get_recipe_cost_estimate.side_effect = lambda rid, prefer: {
+        "recipe_id": rid,
+        "total_cost": 10.0,
+    }
+    svc.repo.get_recipe_cost_estimates.side_effect = lambda ids, prefer: {
+        rid: {"recipe_id": rid, "total_cost": 10.0} for rid in ids if rid != "empty"
+    }
+    yield svc
+    invalidate_recipe_caches()
+
+
+class TestCostCache:
+    """Tests for the recipe cost estimate cache."""
+
+    async def test_estimate_is_memoized(self, service):
+        """Test repeated estimates hit the repository once."""
+        first = await service.estimate_recipe_cost("r1")
+        second = await service.estimate_recipe_cost("r1")
+
+        assert first == second == {"recipe_id": "r1", "total_cost": 10.0}
+        service.repo.get_recipe_cost_estimate.assert_awaited_once()
+
+    async def test_batch_only_queries_missing_ids(self, service):
+        """Test batch estimates reuse cached entries, including misses."""
+        await service.estimate_recipe_cost("r1")
+
+        first = await service.estimate_recipe_costs(["r1", "r2", "empty"])
+        second = await service.estimate_recipe_costs(["r1", "r2", "empty"])
+
+        assert set(first) == set(second) == {"r1", "r2"}
+        service.repo.get_recipe_cost_estimates.assert_awaited_once_with(["r2", "empty"], True)
+
+    async def test_cache_expires(self, service, monkeypatch):
+        """Test entries older than the TTL are re-fetched."""
+        await service.estimate_recipe_cost("r1")
+        later = time.monotonic() + graph_service_module.COST_CACHE_TTL + 1
+        monkeypatch.setattr(graph_service_module, "time", SimpleNamespace(monotonic=lambda: later))
+        await service.estimate_recipe_cost("r1")
+        await service.estimate_recipe_cost("r1")
+
+        assert service.repo.get_recipe_cost_estimate.await_count == 2
+
+    async def test_product_sync_invalidates(self, service):
+        """Test syncing products drops memoized estimates."""
+        await service.estimate_recipe_cost("r1")
+        await service.sync_products_batch([])
+        await service.estimate_recipe_cost("r1")
+
+        assert service.repo.get_recipe_cost_estimate.await_count == 2
+
+
+@pytest.fixture
+def search_service():
+    """GraphService with a mocked repository and empty recipe caches."""
+    invalidate_recipe_caches()
+    svc = GraphService(MagicMock())
+    svc.repo = AsyncMock()
+    svc.repo.search_recipes.return_value = [{"id": "r1"}]
+    svc.repo.find_recipes_by_discounted_ingredients.return_value = []
+    svc.repo.count_recipes.return_value = 42
+    svc.repo.get_all_categories.return_value = []
+    svc.repo.get_stats.return_value = {"recipes": 1}
+    yield svc
+    invalidate_recipe_caches()
+
+
+class TestSearchCache:
+    """Tests for the recipe search result cache."""
+
+    async def test_search_is_memoized_per_arguments(self, search_service):
+        """Test identical searches hit the repository once."""
+        first = await search_service.search_recipes(name="soup")
+        second = await search_service.search_recipes(name="soup")
+        await search_service.search_recipes(name="soup", offset=20)
+
+        assert first == second == [{"id": "r1"}]
+        assert first is not second
+        assert search_service.repo.search_recipes.await_count == 2
+
+    async def test_count_is_memoized(self, search_service):
+        """Test repeated recipe counts hit the repository once."""
+        first = await search_service.count_recipes(category="Dessert")
+        second = await search_service.count_recipes(category="Dessert")
+
+        assert first == second == 42
+        search_service.repo.count_recipes.assert_awaited_once()
+
+    async def test_discount_listing_is_memoized(self, search_service):
+        """Test repeated discount listings hit the repository once."""
+        await search_service.find_recipes_with_discounts(limit=5)
+        await search_service.find_recipes_with_discounts(limit=5)
+
+        search_service.repo.find_recipes_by_discounted_ingredients.assert_awaited_once()
+
+    async def test_recipe_delete_invalidates(self, search_service):
+        """Test graph writes drop memoized search results."""
+        await search_service.search_recipes(name="soup")
+        await search_service.delete_recipe("r1")
+        await search_service.search_recipes(name="soup")
+
+        assert search_service.repo.search_recipes.await_count == 2
+
+    async def test_search_during_write_is_not_kept(self, search_service):
+        """Test a search that runs while a write is in flight is dropped afterwards."""
+
+        async def delete_with_concurrent_search(recipe_id):
+            await search_service.search_recipes(name="soup")
+            return True
+
+        search_service.repo.delete_recipe.side_effect = delete_with_concurrent_search
+        await search_service.delete_recipe("r1")
+        await search_service.search_recipes(name="soup")
+
+        assert search_service.repo.search_recipes.await_count == 2
+
+    async def test_listings_and_stats_are_memoized(self, search_service):
+        """Test category listings and graph stats hit the repository once."""
+        await search_service.get_categories()
+        await search_service.get_categories()
+        stats = await search_service.get_stats()
+        stats["recipes"] = 99
+
+        assert await search_service.get_stats() == {"recipes": 1}
+        search_service.repo.get_all_categories.assert_awaited_once()
+        search_service.repo.get_stats.assert_awaited_once()
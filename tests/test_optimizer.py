@@ -202,16 +202,19 @@ class TestMealPlanOptimizer:
         """Test optimize returns optimized recipes."""
         # Setup mocks
         mock_graph_service.find_recipes_with_discounts.return_value = sample_discount_results
-        mock_graph_service.get_recipe.side_effect = lambda rid: next(
-            (r for r in sample_recipes if r.id == rid), None
-        )
-        mock_graph_service.estimate_recipe_cost.return_value = {
-            "total_cost": 85.0,
-            "total_savings": 15.0,
-            "items": [
-                {"ingredient": "chicken", "has_discount": True},
-            ],
+        mock_graph_service.get_recipes.side_effect = lambda ids: {
+            r.id: r for r in sample_recipes if r.id in ids
         }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: dict.fromkeys(
+            ids,
+            {
+                "total_cost": 85.0,
+                "total_savings": 15.0,
+                "items": [
+                    {"ingredient": "chicken", "has_discount": True},
+                ],
+            },
+        )
         mock_graph_service.search_recipes.return_value = sample_recipes
 
         optimizer = MealPlanOptimizer(mock_graph_service)
@@ -230,14 +233,17 @@ class TestMealPlanOptimizer:
     ):
         """Test optimizer returns at most 'days' recipes."""
         mock_graph_service.find_recipes_with_discounts.return_value = sample_discount_results
-        mock_graph_service.get_recipe.side_effect = lambda rid: next(
-            (r for r in sample_recipes if r.id == rid), None
-        )
-        mock_graph_service.estimate_recipe_cost.return_value = {
-            "total_cost": 50.0,
-            "total_savings": 5.0,
-            "items": [],
+        mock_graph_service.get_recipes.side_effect = lambda ids: {
+            r.id: r for r in sample_recipes if r.id in ids
         }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: dict.fromkeys(
+            ids,
+            {
+                "total_cost": 50.0,
+                "total_savings": 5.0,
+                "items": [],
+            },
+        )
         mock_graph_service.search_recipes.return_value = sample_recipes
 
         optimizer = MealPlanOptimizer(mock_graph_service)
@@ -252,14 +258,17 @@ class TestMealPlanOptimizer:
     ):
         """Test optimizer respects budget constraints."""
         mock_graph_service.find_recipes_with_discounts.return_value = sample_discount_results
-        mock_graph_service.get_recipe.side_effect = lambda rid: next(
-            (r for r in sample_recipes if r.id == rid), None
-        )
-        mock_graph_service.estimate_recipe_cost.return_value = {
-            "total_cost": 100.0,  # High cost
-            "total_savings": 0.0,
-            "items": [],
+        mock_graph_service.get_recipes.side_effect = lambda ids: {
+            r.id: r for r in sample_recipes if r.id in ids
         }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: dict.fromkeys(
+            ids,
+            {
+                "total_cost": 100.0,  # High cost
+                "total_savings": 0.0,
+                "items": [],
+            },
+        )
         mock_graph_service.search_recipes.return_value = sample_recipes
 
         optimizer = MealPlanOptimizer(mock_graph_service)
@@ -275,6 +284,32 @@ class TestMealPlanOptimizer:
         total_cost = sum(r.estimated_cost for r in result)
         assert total_cost <= 100.0 or len(result) == 0
 
+    @pytest.mark.asyncio
+    async def test_fetch_candidates_batches_graph_queries(
+        self, mock_graph_service, sample_recipes, sample_discount_results
+    ):
+        """Test candidates are fetched and costed with one query per branch."""
+        mock_graph_service.find_recipes_with_discounts.return_value = sample_discount_results
+        mock_graph_service.get_recipes.side_effect = lambda ids: {
+            r.id: r for r in sample_recipes if r.id in ids
+        }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: {
+            rid: {"total_cost": 40.0, "total_savings": 0.0, "items": []} for rid in ids
+        }
+        mock_graph_service.search_recipes.return_value = sample_recipes
+
+        optimizer = MealPlanOptimizer(mock_graph_service)
+
+        candidates = await optimizer._fetch_candidates()
+
+        assert [c.recipe.id for c in candidates] == ["recipe-1", "recipe-2", "recipe-4", "recipe-3"]
+        mock_graph_service.get_recipes.assert_awaited_once_with(
+            ["recipe-1", "recipe-2", "recipe-4"]
+        )
+        assert mock_graph_service.estimate_recipe_costs.await_count == 2
+        mock_graph_service.get_recipe.assert_not_awaited()
+        mock_graph_service.estimate_recipe_cost.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_optimize_empty_when_no_recipes(self, mock_graph_service):
         """Test optimizer returns empty list when no recipes available."""
@@ -302,14 +337,17 @@ class TestDietaryFiltering:
     ):
         """Test vegetarian filter excludes meat recipes."""
         mock_graph_service.find_recipes_with_discounts.return_value = sample_discount_results
-        mock_graph_service.get_recipe.side_effect = lambda rid: next(
-            (r for r in sample_recipes if r.id == rid), None
-        )
-        mock_graph_service.estimate_recipe_cost.return_value = {
-            "total_cost": 50.0,
-            "total_savings": 5.0,
-            "items": [],
+        mock_graph_service.get_recipes.side_effect = lambda ids: {
+            r.id: r for r in sample_recipes if r.id in ids
         }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: dict.fromkeys(
+            ids,
+            {
+                "total_cost": 50.0,
+                "total_savings": 5.0,
+                "items": [],
+            },
+        )
         mock_graph_service.search_recipes.return_value = [
             r for r in sample_recipes if r.category == "Vegetarian"
         ]
@@ -357,6 +395,25 @@ class TestDietaryFiltering:
         # Vegetable pasta has pasta (contains gluten), should not match
         assert not optimizer._matches_dietary(sample_recipes[2], gf_pref)
 
+    def test_matches_dietary_allergy(self, mock_graph_service, sample_recipes):
+        """Test _matches_dietary excludes recipes containing an allergen substring."""
+        optimizer = MealPlanOptimizer(mock_graph_service)
+
+        soy_allergy = [DietaryPreference(name="Soy", type="allergy")]
+
+        # Chicken stir fry and salmon teriyaki use soy sauce
+        assert not optimizer._matches_dietary(sample_recipes[0], soy_allergy)
+        assert not optimizer._matches_dietary(sample_recipes[3], soy_allergy)
+        assert optimizer._matches_dietary(sample_recipes[1], soy_allergy)
+
+    def test_matches_dietary_unknown_preference(self, mock_graph_service, sample_recipes):
+        """Test unknown preferences do not filter anything out."""
+        optimizer = MealPlanOptimizer(mock_graph_service)
+
+        keto_pref = [DietaryPreference(name="keto", type="preference")]
+
+        assert all(optimizer._matches_dietary(r, keto_pref) for r in sample_recipes)
+
 
 # =============================================================================
 # Scoring Tests
@@ -423,12 +480,12 @@ class TestFindReplacement:
     async def test_find_replacement_cheaper(self, mock_graph_service, sample_recipes):
         """Test finding cheaper replacement recipes."""
         mock_graph_service.get_recipe.return_value = sample_recipes[0]
-        mock_graph_service.estimate_recipe_cost.side_effect = [
-            {"total_cost": 100.0},  # Original
-            {"total_cost": 50.0},  # Cheaper alternative
-            {"total_cost": 150.0},  # More expensive
-            {"total_cost": 60.0},  # Another cheaper
-        ]
+        mock_graph_service.estimate_recipe_costs.return_value = {
+            "recipe-1": {"total_cost": 100.0},  # Original
+            "recipe-2": {"total_cost": 50.0},  # Cheaper alternative
+            "recipe-3": {"total_cost": 150.0},  # More expensive
+            "recipe-4": {"total_cost": 60.0},  # Another cheaper
+        }
         mock_graph_service.search_recipes.return_value = sample_recipes[1:]
 
         optimizer = MealPlanOptimizer(mock_graph_service)
@@ -447,10 +504,13 @@ class TestFindReplacement:
     async def test_find_replacement_different(self, mock_graph_service, sample_recipes):
         """Test finding different category replacement."""
         mock_graph_service.get_recipe.return_value = sample_recipes[0]
-        mock_graph_service.estimate_recipe_cost.return_value = {
-            "total_cost": 50.0,
-            "total_savings": 0.0,
-        }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: dict.fromkeys(
+            ids,
+            {
+                "total_cost": 50.0,
+                "total_savings": 0.0,
+            },
+        )
         mock_graph_service.search_recipes.return_value = sample_recipes
 
         optimizer = MealPlanOptimizer(mock_graph_service)
@@ -470,10 +530,13 @@ class TestFindReplacement:
     async def test_find_replacement_excludes_original(self, mock_graph_service, sample_recipes):
         """Test that original recipe is excluded from replacements."""
         mock_graph_service.get_recipe.return_value = sample_recipes[0]
-        mock_graph_service.estimate_recipe_cost.return_value = {
-            "total_cost": 50.0,
-            "total_savings": 0.0,
-        }
+        mock_graph_service.estimate_recipe_costs.side_effect = lambda ids: dict.fromkeys(
+            ids,
+            {
+                "total_cost": 50.0,
+                "total_savings": 0.0,
+            },
+        )
         mock_graph_service.search_recipes.return_value = sample_recipes
 
         optimizer = MealPlanOptimizer(mock_graph_service)
@@ -568,3 +631,35 @@ class TestGreedySelection:
 
         total_cost = sum(r.estimated_cost for r in selected)
         assert total_cost <= 200.0
+
+    def test_greedy_select_budget_prefers_bang_per_buck(self, mock_graph_service, sample_recipes):
+        """Test that with a budget, score per krone beats raw score."""
+        optimizer = MealPlanOptimizer(mock_graph_service)
+
+        scored = [
+            RecipeScore(recipe=sample_recipes[0], total_score=10.0, estimated_cost=200.0),
+            RecipeScore(recipe=sample_recipes[1], total_score=8.0, estimated_cost=50.0),
+            RecipeScore(recipe=sample_recipes[2], total_score=6.0, estimated_cost=50.0),
+        ]
+
+        with_budget = optimizer._greedy_select(scored, days=3, budget_max=200.0, people_count=1)
+        without_budget = optimizer._greedy_select(scored, days=3, budget_max=None, people_count=1)
+
+        assert [r.recipe_id for r in with_budget] == ["recipe-2", "recipe-3"]
+        assert [r.recipe_id for r in without_budget] == ["recipe-1", "recipe-2", "recipe-3"]
+
+    def test_greedy_select_generates_reasons(self, mock_graph_service, sample_recipes):
+        """Test that suggestion reasons are built for selected recipes only when missing."""
+        optimizer = MealPlanOptimizer(mock_graph_service)
+
+        scored = [
+            RecipeScore(recipe=sample_recipes[0], discount_count=2, total_score=6.0),
+            RecipeScore(recipe=sample_recipes[1], total_score=5.0, suggestion_reason="Chef's pick"),
+        ]
+
+        selected = optimizer._greedy_select(scored, days=2, budget_max=None, people_count=2)
+
+        assert [r.suggestion_reason for r in selected] == [
+            "Uses 2 discounted ingredient(s)",
+            "Chef's pick",
+        ]
@@ -1,6 +1,8 @@
 """Tests for web scraper functionality."""
 
+import asyncio
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -10,6 +12,7 @@ from foodplanner.ingest.scrapers import (
     get_available_scrapers,
     get_scraper_for_store,
 )
+from foodplanner.ingest.scrapers import rema1000 as rema1000_module
 from foodplanner.ingest.scrapers.base import RateLimitError, ScrapedProduct
 
 
@@ -219,6 +222,107 @@ class TestRema1000Scraper:
         # Browser should be closed after context
         assert scraper._browser is None
 
+    async def test_relaunch_stops_previous_driver(self, monkeypatch):
+        """Test relaunching after a browser disconnect stops the old Playwright driver."""
+        scraper = Rema1000Scraper()
+        old_playwright = AsyncMock()
+        scraper._playwright = old_playwright
+        scraper._browser = MagicMock(is_connected=MagicMock(return_value=False))
+        new_playwright = AsyncMock()
+        monkeypatch.setattr(
+            rema1000_module,
+            "async_playwright",
+            lambda: MagicMock(start=AsyncMock(return_value=new_playwright)),
+        )
+
+        browser = await scraper._get_browser()
+
+        old_playwright.stop.assert_awaited_once()
+        assert scraper._playwright is new_playwright
+        assert browser is new_playwright.chromium.launch.return_value
+
+
+class TestConcurrentCategoryScrape:
+    """Tests for scraping categories in parallel lanes."""
+
+    @pytest.fixture(autouse=True)
+    def no_jitter(self, monkeypatch):
+        """Drop the random pause added between categories."""
+        monkeypatch.setattr(rema1000_module.random, "uniform", lambda a, b: 0)
+
+    @staticmethod
+    def _fake_category_scrape(scraper, active, peak):
+        """Replace per-category scraping with a stub that tracks overlap."""
+
+        async def scrape_category(category_slug, include_details, progress, use_persistent):
+            assert use_persistent is False
+            active.add(category_slug)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.discard(category_slug)
+            for n in range(2):
+                yield {"id": f"{category_slug}-{n}"}
+
+        scraper.scrape_category_products_full = scrape_category
+
+    async def test_all_categories_scraped_within_concurrency(self):
+        """Test every category's products are yielded with bounded overlap."""
+        scraper = Rema1000Scraper(category_delay=0, category_concurrency=2)
+        active: set[str] = set()
+        peak: list[int] = []
+        self._fake_category_scrape(scraper, active, peak)
+        reports = []
+
+        products = [
+            p["id"]
+            async for p in scraper.scrape_all_products(
+                categories=["a", "b", "c"],
+                progress_callback=lambda progress: reports.append(progress.categories_completed),
+            )
+        ]
+
+        assert sorted(products) == ["a-0", "a-1", "b-0", "b-1", "c-0", "c-1"]
+        assert max(peak) == 2
+        assert reports[-1] == 3
+
+    async def test_lane_failure_propagates(self):
+        """Test a tripped circuit breaker in one lane stops the scrape."""
+        scraper = Rema1000Scraper(category_delay=0, category_concurrency=2)
+
+        async def scrape_category(category_slug, include_details, progress, use_persistent):
+            if category_slug == "b":
+                raise ScraperError("Circuit breaker tripped")
+            await asyncio.sleep(0.01)
+            yield {"id": category_slug}
+
+        scraper.scrape_category_products_full = scrape_category
+
+        with pytest.raises(ScraperError, match="Circuit breaker"):
+            async for _ in scraper.scrape_all_products(categories=["a", "b", "c"]):
+                pass
+
+    async def test_early_close_with_full_queue_stops_lanes(self):
+        """Test closing the scrape after the lanes fill the queue does not hang."""
+        scraper = Rema1000Scraper(category_delay=0, category_concurrency=2)
+        closed: list[str] = []
+
+        async def scrape_category(category_slug, include_details, progress, use_persistent):
+            try:
+                for n in range(500):
+                    yield {"id": f"{category_slug}-{n}"}
+            finally:
+                closed.append(category_slug)
+
+        scraper.scrape_category_products_full = scrape_category
+
+        products = scraper.scrape_all_products(categories=["a", "b", "c"])
+        async for _ in products:
+            await asyncio.sleep(0.01)  # Let the lanes fill the queue
+            break
+        await asyncio.wait_for(products.aclose(), timeout=1)
+
+        assert sorted(closed) == ["a", "b"]
+
 
 class TestScraperErrors:
     """Tests for scraper error handling."""
@@ -1,5 +1,6 @@
 """Unit tests for shopping list generation and unit normalization."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -8,6 +9,7 @@ from foodplanner.normalize.units import (
     aggregate_ingredients,
     can_aggregate,
     extract_quantity_and_unit,
+    identify_unit_type,
     normalize_ingredient_name,
     normalize_quantity,
     parse_quantity_string,
@@ -126,6 +128,12 @@ class TestNormalizeQuantity:
         assert result.value == 2.0
         assert result.unit_type == "count"
 
+    def test_numeric_quantity_keeps_original_text(self):
+        """Test numeric quantities keep their plain text representation."""
+        assert normalize_quantity(1000000, "g").original_quantity == "1000000"
+        assert normalize_quantity(1.5, "kg").original_quantity == "1.5"
+        assert normalize_quantity(0, "g").original_quantity == "1"
+
 
 class TestNormalizedQuantityArithmetic:
     """Tests for NormalizedQuantity arithmetic operations."""
@@ -152,6 +160,29 @@ class TestNormalizedQuantityArithmetic:
         result = qty1 + qty2
         assert result.value == 500.0  # Returns first quantity unchanged
 
+    def test_iadd_in_place(self):
+        """Test in-place addition mutates and tracks original quantities."""
+        qty1 = normalize_quantity("500", "ml")
+        qty2 = normalize_quantity("250", "ml")
+        result = qty1.iadd(qty2)
+        assert result is qty1
+        assert qty1.value == 750.0
+        assert qty1.original_quantity == "500 + 250"
+
+    def test_iadd_matches_add(self):
+        """Test in-place addition gives the same result as ``+``."""
+        added = normalize_quantity("2", "Cloves") + normalize_quantity("1", "cloves")
+        merged = normalize_quantity("2", "Cloves").iadd(normalize_quantity("1", "cloves"))
+        assert merged == added
+        assert merged.to_display_string() == ("3", "cloves")
+
+    def test_iadd_different_unit_types(self):
+        """Test in-place addition of different unit types is a no-op."""
+        qty1 = normalize_quantity("500", "ml")
+        qty1.iadd(normalize_quantity("250", "g"))
+        assert qty1.value == 500.0
+        assert qty1.original_quantity == "500"
+
 
 class TestNormalizedQuantityDisplay:
     """Tests for NormalizedQuantity display formatting."""
@@ -184,6 +215,21 @@ class TestNormalizedQuantityDisplay:
         assert display_qty == "1.5"
         assert display_unit == "kg"
 
+    def test_display_trims_trailing_zeros(self):
+        """Test whole and fractional liters/kilograms drop trailing zeros."""
+        assert normalize_quantity("1000", "ml").to_display_string() == ("1", "L")
+        assert normalize_quantity("1234", "ml").to_display_string() == ("1.2", "L")
+        assert normalize_quantity("2000", "g").to_display_string() == ("2", "kg")
+        assert normalize_quantity("1250", "g").to_display_string() == ("1.25", "kg")
+        assert normalize_quantity("12345", "g").to_display_string() == ("12.35", "kg")
+        assert normalize_quantity("999.5", "ml").to_display_string() == ("10", "dl")
+
+    def test_display_large_values_without_exponent(self):
+        """Test values of 1000 L/kg and more stay in fixed-point notation."""
+        assert normalize_quantity("2500000", "ml").to_display_string() == ("2500", "L")
+        assert normalize_quantity("500486", "ml").to_display_string() == ("500.5", "L")
+        assert normalize_quantity("1500000", "g").to_display_string() == ("1500", "kg")
+
     def test_display_grams(self):
         """Test displaying small weights as grams."""
         qty = normalize_quantity("250", "g")
@@ -192,6 +238,33 @@ class TestNormalizedQuantityDisplay:
         assert display_unit == "g"
 
 
+class TestIdentifyUnitType:
+    """Tests for identify_unit_type function."""
+
+    def test_known_units(self):
+        """Test lookups in the conversion tables."""
+        assert identify_unit_type("ml") == ("volume", 1.0)
+        assert identify_unit_type("KG") == ("weight", 1000.0)
+        assert identify_unit_type("cloves") == ("count", 1.0)
+
+    def test_size_descriptors(self):
+        """Test size descriptors map to count factors."""
+        assert identify_unit_type("small") == ("count", 0.75)
+        assert identify_unit_type("large") == ("count", 1.5)
+        assert identify_unit_type("extra large") == ("count", 2.0)
+
+    def test_size_descriptor_substrings(self):
+        """Test descriptors embedded in longer words still count as sizes."""
+        assert identify_unit_type("largest") == ("count", 1.5)
+        assert identify_unit_type("smaller") == ("count", 0.75)
+        assert identify_unit_type("xlarge") == ("count", 2.0)
+        assert can_aggregate("xlarge", "large")
+
+    def test_unknown_unit(self):
+        """Test unrecognised units."""
+        assert identify_unit_type("handful") == ("unknown", 1.0)
+
+
 class TestExtractQuantityAndUnit:
     """Tests for extract_quantity_and_unit function."""
 
@@ -271,6 +344,18 @@ class TestAggregateIngredients:
         assert "onion" in result
         assert result["onion"].total_quantity.value == 3.0
 
+    def test_aggregate_keeps_original_quantities(self):
+        """Test merged rows keep all original quantities and the base unit."""
+        ingredients = [
+            {"name": "garlic", "quantity": "2", "measure": "Cloves"},
+            {"name": "garlic", "quantity": "1", "measure": "cloves"},
+        ]
+        result = aggregate_ingredients(ingredients, "recipe-1")
+
+        total = result["garlic"].total_quantity
+        assert total.original_quantity == "2 + 1"
+        assert total.to_display_string() == ("3", "cloves")
+
     def test_aggregate_with_units(self):
         """Test aggregating with unit conversion."""
         ingredients = [
@@ -443,6 +528,48 @@ class TestShoppingList:
         assert shopping_list.matched_items_count == 1
         assert shopping_list.unmatched_items_count == 1
 
+    def test_add_items_matches_add_item(self):
+        """Test that add_items gives the same totals and groups as repeated add_item."""
+
+        def make_items() -> list[ShoppingItem]:
+            return [
+                ShoppingItem(
+                    ingredient_name=name,
+                    normalized_name=name,
+                    quantity="1",
+                    unit="",
+                    price=price,
+                    discount_price=discount,
+                    product_id=f"prod-{name}" if price else None,
+                    category=category,
+                    store_name=store,
+                )
+                for name, price, discount, category, store in [
+                    ("chicken", 50.0, 40.0, "Meat", "REMA"),
+                    ("onion", 5.0, None, "Vegetables", "Netto"),
+                    ("saffron", None, None, None, None),
+                    ("beef", 60.0, 55.0, "Meat", "REMA"),
+                ]
+            ]
+
+        one_by_one = ShoppingList(meal_plan_id="plan-1")
+        for item in make_items():
+            one_by_one.add_item(item)
+
+        batched = ShoppingList(meal_plan_id="plan-1")
+        batched.add_items(make_items())
+
+        assert batched.total_cost == one_by_one.total_cost == 100.0
+        assert batched.total_savings == one_by_one.total_savings == 15.0
+        assert batched.matched_items_count == 3
+        assert batched.unmatched_items_count == 1
+        assert list(batched.items_by_category) == ["Meat", "Vegetables", "Other"]
+        assert list(batched.items_by_store) == ["REMA", "Netto", "Unknown Store"]
+        assert [i.ingredient_name for i in batched.items_by_category["Meat"]] == [
+            "chicken",
+            "beef",
+        ]
+
 
 class TestShoppingListGenerator:
     """Tests for ShoppingListGenerator class."""
@@ -555,6 +682,34 @@ class TestShoppingListGenerator:
         assert result.items[0].discount_price == 40.0
         assert result.matched_items_count == 1
 
+    @pytest.mark.asyncio
+    async def test_generate_matches_concurrently_in_order(self, mock_graph_service):
+        """Test product lookups overlap but items keep aggregation order."""
+        in_flight = 0
+        peak = 0
+
+        async def get_products(name, min_confidence, limit):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later ingredients finish first
+            await asyncio.sleep(0.001 * (20 - len(name)))
+            in_flight -= 1
+            return []
+
+        mock_graph_service.get_products_for_ingredient.side_effect = get_products
+
+        generator = ShoppingListGenerator(mock_graph_service)
+        names = [f"ingredient {'x' * i}" for i in range(10)]
+
+        result = await generator.generate(
+            meal_plan_id="plan-1",
+            recipes_ingredients=[("recipe-1", [{"name": n} for n in names])],
+        )
+
+        assert [item.ingredient_name for item in result.items] == names
+        assert 1 < peak <= ShoppingListGenerator.MATCH_CONCURRENCY
+
     @pytest.mark.asyncio
     async def test_select_best_product_prefers_discount(self, mock_graph_service):
         """Test that _select_best_product prefers discounted items."""
@@ -615,3 +770,16 @@ class TestShoppingListGenerator:
         best = generator._select_best_product(products, ["preferred-store"])
 
         assert best["p"]["id"] == "prod-2"  # From preferred store
+
+    def test_select_best_product_tie_keeps_first(self, mock_graph_service):
+        """Test that equally scored products resolve to the first one."""
+        generator = ShoppingListGenerator(mock_graph_service)
+
+        products = [
+            {"p": {"id": f"prod-{i}", "price": 40.0}, "confidence": 0.9, "store_id": "store-1"}
+            for i in range(3)
+        ]
+
+        best = generator._select_best_product(products, ["store-1"])
+
+        assert best["p"]["id"] == "prod-0"